@@ -0,0 +1,58 @@
+"""
+Compares `BaseModel.construct` with the validating `__init__` on trusted data.
+
+Usage: python benchmarks/bench_construct.py [--number N]
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from polymathes.models import BaseModel  # noqa: E402
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+class Record(BaseModel):
+    id: int
+    name: str
+    price: float
+    active: bool
+    tags: list[str]
+    item: Item
+    note: str | None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    data = {
+        "id": 1,
+        "name": "record",
+        "price": 9.99,
+        "active": True,
+        "tags": ["a", "b", "c"],
+        "item": {"id": 2, "name": "item"},
+        "note": None,
+    }
+    trusted = {**data, "item": Item(**data["item"])}
+
+    init = min(timeit.repeat(lambda: Record(**data), number=args.number, repeat=5))
+    construct = min(timeit.repeat(lambda: Record.construct(**trusted), number=args.number, repeat=5))
+    batch = min(timeit.repeat(lambda: Record.construct_many([trusted] * 1000), number=args.number // 1000, repeat=5))
+
+    print(f"__init__:       {args.number / init:12,.0f} ops/s")
+    print(f"construct:      {args.number / construct:12,.0f} ops/s ({init / construct:.1f}x)")
+    print(f"construct_many: {args.number / batch:12,.0f} ops/s ({init / batch:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Measures the cost of raising validation errors: errors caught and thrown away, errors collected from a batch, and the
+full field name of errors raised deep inside nested models.
+
+Usage: python benchmarks/bench_errors.py [--number N] [--depth D]
+"""
+
+import argparse
+import sys
+import timeit
+from contextlib import suppress
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from polymathes.errors import ValidationError  # noqa: E402
+from polymathes.models import BaseModel  # noqa: E402
+
+
+class Record(BaseModel):
+    id: int
+    values: list[int]
+
+
+def nested(depth: int) -> tuple[type, list]:
+    """
+    Builds a model with a field nested `depth` lists deep, and a value for it whose innermost item is invalid.
+    """
+    field_type: type = int
+    value: list = ["invalid"]
+    for _ in range(depth):
+        field_type = list[field_type]
+        value = [value]
+
+    return type("Nested", (BaseModel,), {"__annotations__": {"values": field_type}}), value
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=100_000)
+    parser.add_argument("--depth", type=int, default=200)
+    args = parser.parse_args()
+
+    invalid = {"id": 1, "values": [1, 2, "x"]}
+
+    def discard() -> None:
+        with suppress(ValidationError):
+            Record(**invalid)
+
+    batch = [invalid] * 1000
+
+    def collect() -> None:
+        errors = []
+        Record.validate_many(batch, errors=errors)
+
+    model, values = nested(args.depth)
+
+    def full_name() -> None:
+        try:
+            model(values=values)
+        except ValidationError as ex:
+            ex.get_full_field_name()
+            str(ex)
+
+    results = {
+        "caught and discarded": (discard, args.number),
+        "collected, batch of 1000": (collect, max(args.number // 1000, 1)),
+        f"full field name, depth {args.depth}": (full_name, max(args.number // args.depth, 1)),
+    }
+
+    for name, (function, number) in results.items():
+        elapsed = min(timeit.repeat(function, number=number, repeat=5))
+        print(f"{name:<28}: {elapsed / number * 1e6:10.2f} us/op")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Measures the cold start of importing many `codegen=True` models, without the schema cache, with an empty (cold) cache
+and with a filled (warm) one.
+
+Usage: python benchmarks/bench_schema_cache.py [--models N] [--repeat R]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+SRC = str(Path(__file__).resolve().parent.parent / "src")
+
+MODEL = """
+class Model{index}(BaseModel, codegen=True):
+    id: int
+    name: str
+    price: float
+    active: bool
+    tags: list[str]
+    scores: dict[str, float]
+    point: tuple[int, int]
+    note: str | None
+"""
+
+IMPORT = """
+import time
+start = time.perf_counter()
+import models
+print(time.perf_counter() - start)
+"""
+
+
+def run(directory: str, cache: str | None) -> float:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([SRC, directory]), "PYTHONDONTWRITEBYTECODE": "1"}
+    env.pop("POLYMATHES_SCHEMA_CACHE", None)
+    if cache is not None:
+        env["POLYMATHES_SCHEMA_CACHE"] = cache
+
+    output = subprocess.run([sys.executable, "-c", IMPORT], env=env, check=True, capture_output=True, text=True)
+
+    return float(output.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--models", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = "from polymathes import BaseModel\n" + "".join(MODEL.format(index=i) for i in range(args.models))
+        Path(directory, "models.py").write_text(source)
+        cache = os.path.join(directory, "schema.cache")
+
+        results = {"no cache": [], "cold cache": [], "warm cache": []}
+        for _ in range(args.repeat):
+            results["no cache"].append(run(directory, None))
+
+            if os.path.exists(cache):
+                os.unlink(cache)
+            results["cold cache"].append(run(directory, cache))
+            results["warm cache"].append(run(directory, cache))
+
+    print(f"Importing {args.models} codegen models (best of {args.repeat}):")
+    for name, times in results.items():
+        print(f"  {name:<10}: {min(times) * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Compares the memory taken by each instance of a regular model and of a `slots=True` model.
+
+Usage: python benchmarks/bench_slots.py [--instances N]
+"""
+
+import argparse
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from polymathes.models import BaseModel  # noqa: E402
+
+
+class Point(BaseModel):
+    id: int
+    x: float
+    y: float
+    label: str
+    visible: bool
+
+
+class SlottedPoint(BaseModel, slots=True):
+    id: int
+    x: float
+    y: float
+    label: str
+    visible: bool
+
+
+def measure(model: type[BaseModel], instances: int, dump: bool) -> float:
+    data = [{"id": index, "x": 1.5, "y": 2.5, "label": "point", "visible": True} for index in range(instances)]
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    models = model.validate_many(data)
+    if dump:
+        # CPython only materializes the `__dict__` of an instance once it is accessed.
+        for instance in models:
+            instance.dump()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # The list holding the models is not part of the instances.
+    return (after - before - sys.getsizeof(models)) / instances
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--instances", type=int, default=100_000)
+    args = parser.parse_args()
+
+    for dump in (False, True):
+        regular = measure(Point, args.instances, dump)
+        slotted = measure(SlottedPoint, args.instances, dump)
+
+        print("after dump():" if dump else "after validation:")
+        print(f"  regular: {regular:8.1f} bytes/instance")
+        print(f"  slots:   {slotted:8.1f} bytes/instance ({slotted / regular:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+Runs a scenario for each kind of field validation and reports their throughput and memory as JSON, to compare releases.
+
+Usage:
+    python benchmarks/bench_suite.py [--output results.json] [--filter NAME] [--time SECONDS] [--repeat N]
+    python benchmarks/bench_suite.py --compare baseline.json [--threshold 0.1]
+
+Each scenario reports `ops_per_sec`, the best of several rounds, and `peak_bytes`, the peak memory allocated by one run
+as traced by `tracemalloc`. With `--compare`, exits with status 1 when a scenario is slower than in the baseline by more
+than the threshold.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from contextlib import suppress
+from enum import Enum
+from pathlib import Path
+from typing import Annotated, Any, Literal
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from polymathes import Discriminator  # noqa: E402
+from polymathes.errors import ValidationError  # noqa: E402
+from polymathes.models import BaseModel  # noqa: E402
+
+Wide = type("Wide", (BaseModel,), {"__annotations__": {f"field{i}": (int, float, str, bool)[i % 4] for i in range(40)}})
+WideCodegen = type("WideCodegen", (Wide,), {"__annotations__": Wide.__annotations__}, codegen=True)
+WIDE_DATA = {f"field{i}": (1, 1.5, "a", True)[i % 4] for i in range(40)}
+
+
+class Leaf(BaseModel):
+    id: int
+    name: str
+
+
+def nested_model(depth: int) -> tuple[type, dict]:
+    model, data = Leaf, {"id": 1, "name": "leaf"}
+    for level in range(depth):
+        model = type(f"Level{level}", (BaseModel,), {"__annotations__": {"id": int, "child": model}})
+        data = {"id": level, "child": data}
+
+    return model, data
+
+
+Deep, DEEP_DATA = nested_model(20)
+
+
+class Color(Enum):
+    RED = 1
+    GREEN = 2
+    BLUE = 3
+
+
+class Cat(BaseModel):
+    kind: Literal["cat"]
+    lives: int
+
+
+class Dog(BaseModel):
+    kind: Literal["dog"]
+    good: bool
+
+
+class Containers(BaseModel):
+    ints: list[int]
+
+
+class Keyed(BaseModel):
+    items: dict[str, Leaf]
+
+
+class Variadic(BaseModel):
+    values: tuple[float, ...]
+
+
+class LastUnion(BaseModel):
+    # Every option accepts lists, so each value is tried against all of them.
+    values: list[int] | list[float] | list[str]
+
+
+class ModelUnion(BaseModel):
+    pets: list[Cat | Dog]
+
+
+class Tagged(BaseModel):
+    pets: list[Annotated[Cat | Dog, Discriminator("kind")]]
+
+
+class Enums(BaseModel):
+    colors: list[Color]
+
+
+class Coerced(BaseModel):
+    values: list[int]
+
+
+def valid(model: type, data: dict) -> Callable[[], Any]:
+    return lambda: model(**data)
+
+
+def invalid(model: type, data: dict) -> Callable[[], Any]:
+    def run() -> None:
+        with suppress(ValidationError):
+            model(**data)
+
+    return run
+
+
+PETS = [{"kind": "cat", "lives": 9}, {"kind": "dog", "good": True}] * 500
+
+# The inputs are built once, so only the validation is measured.
+SCENARIOS: dict[str, Callable[[], Any]] = {
+    "wide_flat": valid(Wide, WIDE_DATA),
+    "wide_flat_codegen": valid(WideCodegen, WIDE_DATA),
+    "deep_submodels": valid(Deep, DEEP_DATA),
+    "list_int_10k": valid(Containers, {"ints": list(range(10_000))}),
+    "list_int_coerced_10k": valid(Coerced, {"values": [str(i) for i in range(10_000)]}),
+    "dict_str_model_1k": valid(Keyed, {"items": {str(i): {"id": i, "name": "a"} for i in range(1_000)}}),
+    "tuple_variadic_10k": valid(Variadic, {"values": tuple(float(i) for i in range(10_000))}),
+    "union_last_match_1k": valid(LastUnion, {"values": ["a"] * 1_000}),
+    "union_models_1k": valid(ModelUnion, {"pets": PETS}),
+    "discriminated_1k": valid(Tagged, {"pets": PETS}),
+    "enum_names_1k": valid(Enums, {"colors": ["RED", "GREEN", "BLUE"] * 333}),
+    "errors_flat": invalid(Wide, {**WIDE_DATA, "field39": "not a bool"}),
+    "errors_nested": invalid(Containers, {"ints": [*range(999), "x"]}),
+}
+
+
+def measure(function: Callable[[], Any], min_time: float, repeat: int) -> dict[str, float]:
+    """
+    Measures the throughput of a scenario, as the best of several rounds, and the peak memory allocated by a single run.
+    """
+    function()
+
+    number = 1
+    while True:
+        elapsed = timeit.timeit(function, number=number)
+        if elapsed >= min_time:
+            break
+
+        number *= 2
+
+    elapsed = min([elapsed, *timeit.repeat(function, number=number, repeat=repeat - 1)])
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"ops_per_sec": number / elapsed, "peak_bytes": peak - before}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> bool:
+    """
+    Prints the change of each scenario against the baseline.
+
+    :return: True if no scenario regressed beyond the threshold.
+    """
+    ok = True
+    for name, result in results["scenarios"].items():
+        if name not in baseline["scenarios"]:
+            continue
+
+        base = baseline["scenarios"][name]
+        change = result["ops_per_sec"] / base["ops_per_sec"] - 1
+        regressed = change < -threshold
+        ok = ok and not regressed
+
+        print(
+            f"{name:<24} {change:+8.1%} ops/s  {result['peak_bytes'] - base['peak_bytes']:+10d} bytes"
+            + ("  REGRESSION" if regressed else ""),
+            file=sys.stderr,
+        )
+
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--output", type=Path, help="Writes the results to this file instead of stdout.")
+    parser.add_argument("--filter", help="Only runs the scenarios whose name contains this string.")
+    parser.add_argument("--time", type=float, default=0.1, help="The minimum time of a round, in seconds.")
+    parser.add_argument("--repeat", type=int, default=5, help="The number of rounds of each scenario.")
+    parser.add_argument("--compare", type=Path, help="A previous output to compare the results with.")
+    parser.add_argument("--threshold", type=float, default=0.1, help="The slowdown tolerated by --compare.")
+    args = parser.parse_args()
+
+    results = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "scenarios": {
+            name: measure(function, args.time, args.repeat)
+            for name, function in SCENARIOS.items()
+            if args.filter is None or args.filter in name
+        },
+    }
+
+    output = json.dumps(results, indent=2)
+    if args.output is not None:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+
+    if args.compare is not None and not compare(results, json.loads(args.compare.read_text()), args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
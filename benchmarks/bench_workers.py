@@ -0,0 +1,80 @@
+"""
+Measures how `BaseModel.validate_many(..., workers=N)` scales with the number of worker processes.
+
+Usage: python benchmarks/bench_workers.py [--records N] [--max-workers N] [--chunk-size N]
+"""
+
+import argparse
+import os
+import sys
+import time
+from enum import StrEnum
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from polymathes.models import BaseModel  # noqa: E402
+
+
+class Status(StrEnum):
+    ACTIVE = "active"
+    INACTIVE = "inactive"
+
+
+class Address(BaseModel):
+    street: str
+    number: int
+    zip_code: str
+
+
+class Order(BaseModel):
+    id: int
+    total: float
+    items: list[str]
+
+
+class Customer(BaseModel):
+    id: int
+    name: str
+    status: Status
+    address: Address
+    orders: list[Order]
+    tags: dict[str, str]
+    score: int | float | None
+
+
+def make_record(index: int) -> dict:
+    return {
+        "id": str(index),
+        "name": f"Customer {index}",
+        "status": "ACTIVE",
+        "address": {"street": "Main St", "number": str(index % 1000), "zip_code": 12345},
+        "orders": [{"id": index * 10 + i, "total": str(i * 1.5), "items": ["a", "b", i]} for i in range(3)],
+        "tags": {"source": "bench", "tier": str(index % 3)},
+        "score": index % 7 or None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=1024)
+    args = parser.parse_args()
+
+    data = [make_record(index) for index in range(args.records)]
+
+    start = time.perf_counter()
+    Customer.validate_many(data)
+    baseline = time.perf_counter() - start
+    print(f"in-process: {args.records / baseline:12,.0f} records/s")
+
+    for workers in range(1, args.max_workers + 1):
+        start = time.perf_counter()
+        Customer.validate_many(data, workers=workers, chunk_size=args.chunk_size)
+        elapsed = time.perf_counter() - start
+        print(f"{workers:3} workers: {args.records / elapsed:12,.0f} records/s ({baseline / elapsed:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
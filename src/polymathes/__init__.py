@@ -1,4 +1,18 @@
+from .annotations import Discriminator, Float64Array, Int64Array
+from .config import ModelConfig
+from .metrics import Metrics
 from .models import BaseModel
+from .schemacache import enable_schema_cache
+from .utils.type import register_coercer
 
 __version__ = "0.0.1"
-__all__ = ["BaseModel"]
+__all__ = [
+    "BaseModel",
+    "Discriminator",
+    "Float64Array",
+    "Int64Array",
+    "Metrics",
+    "ModelConfig",
+    "enable_schema_cache",
+    "register_coercer",
+]
@@ -0,0 +1,159 @@
+# Copyright 2025 Dhiego Cassiano Fogaça Barbosa
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Mapping
+from typing import Any
+
+from polymathes.errors import AggregateError, RequiredFieldError, ValidationError
+from polymathes.validators import (
+    DictValidator,
+    DiscriminatedUnionValidator,
+    ListValidator,
+    ModelValidator,
+    TupleValidator,
+    Validator,
+)
+
+
+class _Full(Exception):
+    """
+    Raised by `_Collector.add` to stop the validation once `max_errors` errors were collected.
+    """
+
+
+class _Collector:
+    """
+    Receives the errors found while validating, giving each one its full path.
+    """
+
+    __slots__ = ("errors", "max_errors")
+
+    def __init__(self, max_errors: int) -> None:
+        self.errors: list[ValidationError] = []
+        self.max_errors = max_errors
+
+    def add(self, path: tuple[int | str, ...], ex: ValidationError) -> None:
+        """
+        Adds an error, raised for the last name of the path.
+        """
+        if len(self.errors) >= self.max_errors:
+            # Only raised for an error beyond the limit, so reaching it exactly isn't reported as truncated.
+            raise _Full()
+
+        # The same wrapping as `Validator.validate`, for each of the enclosing values.
+        for field_name in reversed(path[:-1]):
+            ex = ValidationError(None, field_name, ex.value, ex)
+
+        self.errors.append(ex)
+
+
+def _validate(validator: Validator, path: tuple[int | str, ...], value: Any, collector: _Collector) -> None:
+    """
+    Validates a value as a whole, adding its error to the collector.
+    """
+    try:
+        validator.validate(path[-1], value)
+    except ValidationError as ex:
+        collector.add(path, ex)
+
+
+def _has_default_init(model: type) -> bool:
+    """
+    Checks if the `__init__` of a model only validates its fields, so they can be validated one by one instead.
+    """
+    from polymathes.models import BaseModel
+
+    init = model.__init__
+
+    return (
+        init is BaseModel.__init__
+        or getattr(init, "__polymathes_codegen__", False)
+        or getattr(init, "__polymathes_default_init__", False)
+    ) and not model.__config__.lazy
+
+
+def _collect_model(model: type, path: tuple[int | str, ...], data: Mapping[str, Any], collector: _Collector) -> None:
+    """
+    Validates every field of a model, adding their errors to the collector.
+    """
+    # Slotted models only serve their defaults through instances.
+    instance = model.__new__(model)
+
+    for field_name, field_type, validator in model.__fields__:
+        if field_name not in data and not hasattr(instance, field_name):
+            collector.add(path + (field_name,), RequiredFieldError(field_name, field_type, None))
+        else:
+            _collect(validator, path + (field_name,), data.get(field_name), collector)
+
+
+def _collect(validator: Validator, path: tuple[int | str, ...], value: Any, collector: _Collector) -> None:
+    """
+    Validates a value, adding the errors of each of its invalid items (recursively) to the collector.
+    """
+    if isinstance(validator, ListValidator) and isinstance(value, list):
+        for index, item in enumerate(value):
+            _collect(validator.item, path + (index,), item, collector)
+    elif isinstance(validator, TupleValidator) and isinstance(value, tuple):
+        if validator.variadic:
+            for index, item in enumerate(value):
+                _collect(validator.items[0], path + (index,), item, collector)
+        elif len(value) != len(validator.items):
+            _validate(validator, path, value, collector)
+        else:
+            for index, (item_validator, item) in enumerate(zip(validator.items, value, strict=True)):
+                _collect(item_validator, path + (index,), item, collector)
+    elif isinstance(validator, DictValidator) and isinstance(value, dict):
+        for key, item in value.items():
+            _collect(validator.key, path + (key,), key, collector)
+            # Named after the key, unlike `DictValidator.parse` which names it after the value, so paths stay readable.
+            _collect(validator.value, path + (key,), item, collector)
+    elif isinstance(validator, ModelValidator | DiscriminatedUnionValidator) and isinstance(value, Mapping):
+        model = validator.field_type
+        if isinstance(validator, DiscriminatedUnionValidator):
+            try:
+                model = validator.models[type(value[validator.tag]), value[validator.tag]].field_type
+            except (KeyError, TypeError):
+                _validate(validator, path, value, collector)
+                return
+
+        if _has_default_init(model):
+            _collect_model(model, path, value, collector)
+        else:
+            _validate(validator, path, value, collector)
+    else:
+        _validate(validator, path, value, collector)
+
+
+def collect_model_errors(model: type, data: Mapping[str, Any], ex: ValidationError) -> ValidationError:
+    """
+    Validates every field and nested item of a model that failed validation, to report all the errors at once.
+
+    :param model: The model class.
+    :param data: The keyword arguments given to the model.
+    :param ex: The first error, raised by the fail-fast validation.
+    :return: The `AggregateError` holding every error found, up to the `max_errors` option of the model, or `ex` itself
+        if it was raised by something other than the field validators (such as a custom `__init__`).
+    """
+    collector = _Collector(model.__config__.max_errors)
+    truncated = False
+
+    try:
+        _collect_model(model, (), data, collector)
+    except _Full:
+        truncated = True
+
+    if not collector.errors:
+        return ex
+
+    return AggregateError(collector.errors, truncated)
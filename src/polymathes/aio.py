@@ -0,0 +1,199 @@
+# Copyright 2025 Dhiego Cassiano Fogaça Barbosa
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Mapping
+from concurrent.futures import Executor
+from time import perf_counter
+from typing import Any
+
+from polymathes.batch import model_builder
+from polymathes.errors import LineError, ValidationError
+
+Record = Mapping[str, Any] | bytes | bytearray | str
+
+
+def _record_size(record: Record) -> int:
+    """
+    Returns the size of a JSON encoded record, in bytes, or 0 for a mapping.
+    """
+    if isinstance(record, str):
+        return len(record.encode())
+
+    return 0 if isinstance(record, Mapping) else len(record)
+
+
+def _validate_record(builder: Callable[[Mapping[str, Any]], Any], record: Record, index: int, offset: int) -> Any:
+    """
+    Validates a record, which is either a mapping or a JSON encoded line.
+
+    :param builder: The function validating a single mapping.
+    :param record: The record.
+    :param index: The index of the record.
+    :param offset: The offset of the record in the input, in bytes, for JSON lines.
+    :return: The model, or None for a blank line.
+    """
+    if not isinstance(record, bytes | bytearray | str):
+        return builder(record)
+
+    if not record.strip():
+        return None
+
+    raw = record.encode() if isinstance(record, str) else bytes(record)
+
+    try:
+        return builder(json.loads(record))
+    except ValidationError as ex:
+        raise LineError(index + 1, offset, raw, None, ex) from None
+    except (ValueError, TypeError) as ex:
+        raise LineError(index + 1, offset, raw, str(ex)) from None
+
+
+def _validate_records(
+    cls: type,
+    index: int,
+    offset: int,
+    records: list[Record],
+    collect: bool,
+) -> tuple[list[Any], list[tuple[int, ValidationError]]]:
+    """
+    Validates a chunk of records, possibly inside an executor.
+
+    :param cls: The model class.
+    :param index: The index of the first record of the chunk.
+    :param offset: The offset of the first record of the chunk, in bytes, for JSON lines.
+    :param records: The records.
+    :param collect: Collects the errors instead of raising the first one.
+    :return: The models and the `(index, error)` pairs.
+    """
+    builder = model_builder(cls)
+    models = []
+    errors = []
+
+    for record in records:
+        try:
+            model = _validate_record(builder, record, index, offset)
+        except ValidationError as ex:
+            if not collect:
+                raise
+
+            errors.append((index, ex))
+        else:
+            if model is not None:
+                models.append(model)
+
+        index += 1
+        offset += _record_size(record)
+
+    return models, errors
+
+
+async def aiter_validate(
+    cls: type,
+    source: AsyncIterable[Record],
+    errors: list[tuple[int, ValidationError]] | None,
+    batch_size: int,
+    max_block: float,
+    executor: Executor | None,
+) -> AsyncIterator[Any]:
+    """
+    Validates the records of an async iterable without blocking the event loop for long.
+
+    Inline, control is given back to the event loop every `batch_size` records or `max_block` seconds, whichever comes
+    first. With an executor, chunks of `batch_size` records are validated there, while the next chunk is being read.
+
+    :param cls: The model class.
+    :param source: The records: mappings, or JSON encoded lines such as the ones of an `asyncio.StreamReader`.
+    :param errors: If given, receives the `(index, error)` pairs instead of raising the first error.
+    :param batch_size: The number of records validated between yields to the event loop, or sent to the executor.
+    :param max_block: The maximum time spent validating between yields to the event loop, in seconds.
+    :param executor: Validates the records in this executor instead of the event loop thread.
+    :return: The models.
+    """
+    if executor is not None:
+        async for model in _aiter_executor(cls, source, errors, batch_size, executor):
+            yield model
+
+        return
+
+    builder = model_builder(cls)
+    index = 0
+    offset = 0
+    count = 0
+    deadline = perf_counter() + max_block
+
+    async for record in source:
+        try:
+            model = _validate_record(builder, record, index, offset)
+        except ValidationError as ex:
+            if errors is None:
+                raise
+
+            errors.append((index, ex))
+            model = None
+
+        index += 1
+        offset += _record_size(record)
+
+        if model is not None:
+            yield model
+
+        count += 1
+        if count >= batch_size or perf_counter() >= deadline:
+            await asyncio.sleep(0)
+            count = 0
+            deadline = perf_counter() + max_block
+
+
+async def _aiter_executor(
+    cls: type,
+    source: AsyncIterable[Record],
+    errors: list[tuple[int, ValidationError]] | None,
+    batch_size: int,
+    executor: Executor,
+) -> AsyncIterator[Any]:
+    loop = asyncio.get_running_loop()
+    pending: asyncio.Future | None = None
+    chunk: list[Record] = []
+    index = 0
+    offset = 0
+
+    async def submit() -> list[Any]:
+        nonlocal pending, chunk, index, offset
+
+        models = []
+        if pending is not None:
+            models, chunk_errors = await pending
+            if errors is not None:
+                errors.extend(chunk_errors)
+
+        pending = None
+        if chunk:
+            pending = loop.run_in_executor(executor, _validate_records, cls, index, offset, chunk, errors is not None)
+            index += len(chunk)
+            offset += sum(_record_size(record) for record in chunk)
+            chunk = []
+
+        return models
+
+    async for record in source:
+        chunk.append(record)
+        if len(chunk) >= batch_size:
+            for model in await submit():
+                yield model
+
+    while chunk or pending is not None:
+        for model in await submit():
+            yield model
@@ -0,0 +1,101 @@
+# Copyright 2025 Dhiego Cassiano Fogaça Barbosa
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import ClassVar
+
+
+class Discriminator:
+    """
+    Marks a union of models as discriminated by a tag field, to be used with `typing.Annotated`.
+
+    Each model of the union must annotate the tag field with a `typing.Literal`:
+
+    ```python
+    class Cat(BaseModel):
+        kind: Literal["cat"]
+
+
+    class Dog(BaseModel):
+        kind: Literal["dog"]
+
+
+    class Owner(BaseModel):
+        pet: Annotated[Cat | Dog, Discriminator("kind")]
+    ```
+    """
+
+    __slots__ = ("field_name",)
+
+    def __init__(self, field_name: str) -> None:
+        """
+
+        :param field_name: The name of the tag field.
+        """
+        self.field_name = field_name
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.field_name!r})"
+
+
+class NumericArray:
+    """
+    The base of the annotations for homogeneous numeric sequences, which are validated in one pass and stored compactly.
+
+    Values are stored in a NumPy array when NumPy is installed, otherwise in an `array.array`. Lists and tuples are
+    converted at once when all of their items already have a numeric type, and item by item (with the coercion rules
+    of the item type) otherwise. Buffers holding items of the same type, or raw bytes in native byte order, are used
+    without copying them with NumPy, and copied in one go into an `array.array` without it.
+
+    ```python
+    class Series(BaseModel):
+        samples: Float64Array
+    ```
+    """
+
+    __slots__ = ()
+
+    # The `array.array` typecode.
+    typecode: ClassVar[str]
+    # The NumPy dtype.
+    dtype: ClassVar[str]
+    # The type of the items, used to coerce them one by one.
+    item_type: ClassVar[type]
+    # The buffer formats holding items of this type, in native byte order.
+    formats: ClassVar[frozenset[str]]
+
+
+class Float64Array(NumericArray):
+    """
+    A sequence of 64-bit floats.
+    """
+
+    __slots__ = ()
+
+    typecode = "d"
+    dtype = "float64"
+    item_type = float
+    formats = frozenset({"d"})
+
+
+class Int64Array(NumericArray):
+    """
+    A sequence of 64-bit signed integers.
+    """
+
+    __slots__ = ()
+
+    typecode = "q"
+    dtype = "int64"
+    item_type = int
+    formats = frozenset({"q", "l"})
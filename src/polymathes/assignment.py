@@ -0,0 +1,94 @@
+# Copyright 2025 Dhiego Cassiano Fogaça Barbosa
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Mapping
+from typing import Any
+
+from polymathes.aggregate import collect_model_errors
+from polymathes.errors import RequiredFieldError, ValidationError
+from polymathes.lazy import RAW
+
+# Stores an attribute without going through the `__setattr__` of the model.
+store = object.__setattr__
+
+
+def bypasses_setattr(cls: type) -> bool:
+    """
+    Checks if the `__init__` of a model must store the fields without going through the `__setattr__` of the model.
+    """
+    return cls.__config__.validate_assignment or cls.__config__.frozen
+
+
+def validating_setattr(self: Any, name: str, value: Any) -> None:
+    """
+    The `__setattr__` of models with `validate_assignment=True`, validating the values assigned to fields.
+    """
+    validator = type(self).__validators__.get(name)
+    if validator is not None:
+        value = validator.validate(name, value)
+
+    store(self, name, value)
+
+
+def assignment_init(self: Any, /, **kwargs) -> None:
+    """
+    The `__init__` of models with `validate_assignment=True` or `frozen=True`, the same as `BaseModel.__init__` except
+    that the values are stored without going through their `__setattr__`.
+    """
+    try:
+        for field_name, field_type, validator in self.__fields__:
+            if field_name not in kwargs and not hasattr(self, field_name):
+                raise RequiredFieldError(field_name, field_type, None)
+
+            store(self, field_name, validator.validate(field_name, kwargs.get(field_name)))
+    except ValidationError as ex:
+        if not self.__config__.collect_errors:
+            raise
+
+        raise collect_model_errors(type(self), kwargs, ex) from None
+
+
+def validate_changes(cls: type, changes: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Validates the new values of some fields of a model, leaving the others untouched.
+
+    :param cls: The model class.
+    :param changes: The new values, by field name.
+    :return: The validated values.
+    """
+    validators = {field_name: validator for field_name, _, validator in cls.__fields__}
+
+    values = {}
+    for field_name, value in changes.items():
+        try:
+            validator = validators[field_name]
+        except KeyError:
+            raise TypeError(f"'{field_name}' is not a field of {cls.__name__}") from None
+
+        values[field_name] = validator.validate(field_name, value)
+
+    return values
+
+
+def apply_changes(self: Any, values: Mapping[str, Any]) -> None:
+    """
+    Stores validated values in a model, dropping the raw values they replace in lazy models.
+    """
+    raw = getattr(self, "__dict__", {}).get(RAW)
+
+    for field_name, value in values.items():
+        store(self, field_name, value)
+
+        if raw:
+            raw.pop(field_name, None)
@@ -0,0 +1,155 @@
+# Copyright 2025 Dhiego Cassiano Fogaça Barbosa
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any
+
+from polymathes.errors import RequiredFieldError, ValidationError
+
+
+def model_builder(cls: type) -> Callable[[Mapping[str, Any]], Any]:
+    """
+    Returns a function validating a mapping into a model, the same as `cls(**data)`.
+
+    When the model uses the default `__init__`, dicts are validated straight from the compiled fields, skipping the
+    keyword arguments unpacking.
+
+    :param cls: The model class.
+    :return: The builder.
+    """
+    from polymathes.models import BaseModel
+
+    if cls.__init__ is not BaseModel.__init__ or cls.__new__ is not object.__new__ or cls.__config__.collect_errors:
+        return lambda data: cls(**data)
+
+    fields = cls.__fields__
+    new = object.__new__
+
+    def build(data: Mapping[str, Any]) -> Any:
+        if type(data) is not dict:
+            return cls(**data)
+
+        self = new(cls)
+        for field_name, field_type, validator in fields:
+            if field_name in data:
+                value = data[field_name]
+            elif hasattr(self, field_name):
+                value = None
+            else:
+                raise RequiredFieldError(field_name, field_type, None)
+
+            setattr(self, field_name, validator.validate(field_name, value))
+
+        return self
+
+    return build
+
+
+def collect_errors(
+    builder: Callable[[Mapping[str, Any]], Any],
+    data: Iterable[Mapping[str, Any]],
+    errors: list[tuple[int, ValidationError]],
+) -> Iterator[Any]:
+    """
+    Validates every mapping, appending the failures to `errors` instead of raising.
+
+    :param builder: The function validating a single mapping.
+    :param data: The mappings.
+    :param errors: Receives the index of each invalid mapping along with its error.
+    :return: The valid models.
+    """
+    for index, item in enumerate(data):
+        try:
+            yield builder(item)
+        except ValidationError as ex:
+            errors.append((index, ex))
+
+
+def _validate_chunk(
+    cls: type,
+    offset: int,
+    chunk: list[Mapping[str, Any]],
+    collect: bool,
+) -> tuple[list[Any], list[tuple[int, ValidationError]]]:
+    """
+    Validates a chunk of mappings inside a worker process.
+
+    :param cls: The model class.
+    :param offset: The index of the first mapping of the chunk in the whole input.
+    :param chunk: The mappings.
+    :param collect: Collects the errors instead of raising the first one.
+    :return: The models and the errors, indexed from the start of the whole input.
+    """
+    builder = model_builder(cls)
+    if not collect:
+        return list(map(builder, chunk)), []
+
+    errors: list[tuple[int, ValidationError]] = []
+    models = list(collect_errors(builder, chunk, errors))
+
+    return models, [(offset + index, ex) for index, ex in errors]
+
+
+def validate_parallel(
+    cls: type,
+    data: Iterable[Mapping[str, Any]],
+    workers: int,
+    chunk_size: int,
+    errors: list[tuple[int, ValidationError]] | None,
+) -> Iterator[Any]:
+    """
+    Validates mappings in chunks on a process pool, yielding the models in input order.
+
+    At most two chunks per worker are in flight at a time, so memory stays bounded for long inputs. The model class must
+    be importable by the workers, i.e. defined at the top level of a module.
+
+    :param cls: The model class.
+    :param data: The mappings.
+    :param workers: The number of worker processes.
+    :param chunk_size: The number of mappings sent to a worker at a time.
+    :param errors: If given, receives the `(index, error)` pairs instead of raising the first error.
+    :return: The models.
+    """
+    iterator = iter(data)
+    pending: deque[Future] = deque()
+    offset = 0
+
+    with ProcessPoolExecutor(workers) as executor:
+
+        def submit() -> bool:
+            nonlocal offset
+
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return False
+
+            pending.append(executor.submit(_validate_chunk, cls, offset, chunk, errors is not None))
+            offset += len(chunk)
+
+            return True
+
+        while len(pending) < workers * 2 and submit():
+            pass
+
+        while pending:
+            models, chunk_errors = pending.popleft().result()
+            submit()
+
+            if errors is not None:
+                errors.extend(chunk_errors)
+
+            yield from models
@@ -0,0 +1,201 @@
+# Copyright 2025 Dhiego Cassiano Fogaça Barbosa
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import linecache
+from collections.abc import Callable
+from typing import Any
+
+from polymathes.aggregate import collect_model_errors
+from polymathes.assignment import store
+from polymathes.errors import RequiredFieldError, UnexpectedTypeError, ValidationError
+from polymathes.schemacache import compile_source
+from polymathes.utils.type import IDENTITY_TYPES
+from polymathes.validators import (
+    DictValidator,
+    EnumValidator,
+    ListValidator,
+    ScalarValidator,
+    TupleValidator,
+    UnionValidator,
+    Validator,
+)
+
+
+class _Generator:
+    """
+    Writes the source of a specialized `__init__` for a model.
+    """
+
+    def __init__(self, bypass_setattr: bool = False) -> None:
+        """
+
+        :param bypass_setattr: Stores the fields with `object.__setattr__`, for the models whose `__setattr__` validates
+            the values again (`validate_assignment=True`) or raises (`frozen=True`).
+        """
+        self.bypass_setattr = bypass_setattr
+        self.lines: list[str] = []
+        self.namespace: dict[str, Any] = {
+            "RequiredFieldError": RequiredFieldError,
+            "UnexpectedTypeError": UnexpectedTypeError,
+            "ValidationError": ValidationError,
+        }
+
+    def constant(self, prefix: str, value: Any) -> str:
+        name = f"_{prefix}{len(self.namespace)}"
+        self.namespace[name] = value
+
+        return name
+
+    def emit(self, indent: int, line: str) -> None:
+        self.lines.append("    " * indent + line)
+
+    def expression(self, validator: Validator, value: str, field_name: str) -> str:
+        """
+        Builds an expression parsing `value`, skipping the validator call when the value already has the exact type.
+
+        :param validator: The validator of the value.
+        :param value: The expression holding the value.
+        :param field_name: The expression holding the field name.
+        :return: The expression.
+        """
+        call = f"{self.constant('v', validator)}.validate({field_name}, {value})"
+
+        if isinstance(validator, ScalarValidator) and validator.field_type in IDENTITY_TYPES:
+            return f"({value} if type({value}) is {self.constant('t', validator.field_type)} else {call})"
+
+        if isinstance(validator, EnumValidator):
+            return f"({value} if type({value}) is {self.constant('t', validator.field_type)} else {call})"
+
+        if isinstance(validator, UnionValidator) and all(
+            isinstance(option, ScalarValidator) and option.field_type in IDENTITY_TYPES for option in validator.options
+        ):
+            types = frozenset(option.field_type for option in validator.options)
+
+            return f"({value} if type({value}) in {self.constant('t', types)} else {call})"
+
+        return call
+
+    def container(self, validator: Validator, field_name: str, indent: int) -> None:
+        """
+        Emits the statements parsing `value` in place for a container validator.
+
+        :param validator: The validator of the field.
+        :param field_name: The expression holding the field name.
+        :param indent: The indentation level.
+        """
+        field_type = self.constant("t", validator.field_type)
+
+        self.emit(indent, "try:")
+        if isinstance(validator, ListValidator):
+            item = self.expression(validator.item, "item", "index")
+            self.emit(indent + 1, "if not isinstance(value, list):")
+            self.emit(indent + 2, f"raise UnexpectedTypeError({field_name}, {field_type}, value)")
+            self.emit(indent + 1, f"value = [{item} for index, item in enumerate(value)]")
+        elif isinstance(validator, TupleValidator) and validator.variadic:
+            item = self.expression(validator.items[0], "item", "index")
+            self.emit(indent + 1, "if not isinstance(value, tuple):")
+            self.emit(indent + 2, f"raise UnexpectedTypeError({field_name}, {field_type}, value)")
+            self.emit(indent + 1, f"value = tuple([{item} for index, item in enumerate(value)])")
+        elif isinstance(validator, TupleValidator):
+            self.emit(indent + 1, f"if not isinstance(value, tuple) or len(value) != {len(validator.items)}:")
+            self.emit(indent + 2, f"raise UnexpectedTypeError({field_name}, {field_type}, value)")
+            if validator.items:
+                names = [f"item{index}" for index in range(len(validator.items))]
+                pairs = zip(validator.items, names, strict=True)
+                items = [self.expression(v, n, str(i)) for i, (v, n) in enumerate(pairs)]
+                self.emit(indent + 1, f"{', '.join(names)}, = value")
+                self.emit(indent + 1, f"value = ({', '.join(items)},)")
+            else:
+                self.emit(indent + 1, "value = ()")
+        elif isinstance(validator, DictValidator):
+            key = self.expression(validator.key, "key", "key")
+            item = self.expression(validator.value, "item", "item")
+            self.emit(indent + 1, "if not isinstance(value, dict):")
+            self.emit(indent + 2, f"raise UnexpectedTypeError({field_name}, {field_type}, value)")
+            self.emit(indent + 1, f"value = {{{key}: {item} for key, item in value.items()}}")
+        self.emit(indent, "except TypeError:")
+        self.emit(indent + 1, f"raise UnexpectedTypeError({field_name}, {field_type}, value) from None")
+        self.emit(indent, "except ValueError:")
+        self.emit(indent + 1, f"raise UnexpectedTypeError({field_name}, {field_type}, value) from None")
+        self.emit(indent, "except ValidationError as ex:")
+        self.emit(indent + 1, f"raise ValidationError(None, {field_name}, ex.value, ex) from None")
+
+    def field(self, field_name: str, field_type: Any, validator: Validator) -> None:
+        name = repr(field_name)
+
+        self.emit(1, f"if {name} in kwargs:")
+        self.emit(2, f"value = kwargs[{name}]")
+        self.emit(1, f"elif hasattr(self, {name}):")
+        self.emit(2, "value = None")
+        self.emit(1, "else:")
+        self.emit(2, f"raise RequiredFieldError({name}, {self.constant('t', field_type)}, None)")
+
+        if isinstance(validator, ListValidator | TupleValidator | DictValidator):
+            self.container(validator, name, 1)
+            self.assign(field_name, "value")
+        else:
+            self.assign(field_name, self.expression(validator, "value", name))
+
+    def assign(self, field_name: str, value: str) -> None:
+        if self.bypass_setattr:
+            self.emit(1, f"_store(self, {field_name!r}, {value})")
+        else:
+            self.emit(1, f"self.{field_name} = {value}")
+
+
+def generate_init(
+    cls: type,
+    fields: tuple[tuple[str, Any, Validator], ...],
+    fallback: Callable[..., None],
+) -> tuple[Callable[..., None], str]:
+    """
+    Generates a specialized `__init__` for a model class.
+
+    Values that already have the exact annotated type are stored as-is, containers are parsed with comprehensions and
+    everything else goes through the compiled validators, so results and errors match `BaseModel.__init__`.
+
+    :param cls: The model class.
+    :param fields: The compiled fields of the model.
+    :param fallback: The `__init__` used when the function is reached from a subclass (through `super().__init__`).
+    :return: The function and its source.
+    """
+    generator = _Generator(cls.__config__.validate_assignment or cls.__config__.frozen)
+    generator.namespace["_store"] = store
+    generator.namespace["_cls"] = cls
+    generator.namespace["_fallback"] = fallback
+
+    generator.emit(0, "def __init__(self, /, **kwargs):")
+    generator.emit(1, "if type(self) is not _cls:")
+    generator.emit(2, "return _fallback(self, **kwargs)")
+    for field_name, field_type, validator in fields:
+        generator.field(field_name, field_type, validator)
+
+    if cls.__config__.collect_errors:
+        generator.namespace["_collect_model_errors"] = collect_model_errors
+        generator.lines[3:] = ["    try:", *("    " + line for line in generator.lines[3:])]
+        generator.emit(1, "except ValidationError as ex:")
+        generator.emit(2, "raise _collect_model_errors(_cls, kwargs, ex) from None")
+
+    source = "\n".join(generator.lines) + "\n"
+    filename = f"<polymathes-codegen {cls.__module__}.{cls.__qualname__}>"
+
+    exec(compile_source(source, filename), generator.namespace)
+    # Allows tracebacks and `inspect.getsource` to show the generated code.
+    linecache.cache[filename] = (len(source), None, source.splitlines(keepends=True), filename)
+
+    function = generator.namespace["__init__"]
+    function.__qualname__ = f"{cls.__qualname__}.__init__"
+    function.__polymathes_codegen__ = True
+
+    return function, source
@@ -0,0 +1,148 @@
+# Copyright 2025 Dhiego Cassiano Fogaça Barbosa
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from array import array
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any
+
+from polymathes.errors import RequiredFieldError, ValidationError
+from polymathes.validators import ScalarValidator, Validator
+
+# The `array.array` typecodes of the scalar fields stored compactly.
+_TYPECODES = {float: "d", int: "q"}
+
+
+class Frame:
+    """
+    The result of `BaseModel.validate_columns`: validated columns of the same length, with a model built for a row only
+    when it is accessed.
+
+    Columns of `float` and `int` fields are stored in an `array.array` (`int` columns holding values beyond 64 bits
+    stay lists), the others in a list.
+    """
+
+    __slots__ = ("model", "columns", "length")
+
+    def __init__(self, model: type, columns: dict[str, Sequence[Any]], length: int) -> None:
+        """
+
+        :param model: The model class.
+        :param columns: The validated columns, by field name.
+        :param length: The number of rows.
+        """
+        self.model = model
+        self.columns = columns
+        self.length = length
+
+    def column(self, field_name: str) -> Sequence[Any]:
+        """
+        Returns the validated values of a field.
+
+        :param field_name: The name of the field.
+        :return: The column.
+        """
+        return self.columns[field_name]
+
+    def row(self, index: int) -> Any:
+        """
+        Builds the model of a row from the validated columns, without validating it again.
+
+        :param index: The index of the row, which may be negative.
+        :return: The model.
+        """
+        if index < 0:
+            index += self.length
+
+        if not 0 <= index < self.length:
+            raise IndexError("Frame index out of range")
+
+        return self.model.construct(**{field_name: column[index] for field_name, column in self.columns.items()})
+
+    def __getitem__(self, index: int) -> Any:
+        return self.row(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(self.length):
+            yield self.row(index)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.model.__name__}, columns={list(self.columns)!r}, length={self.length})"
+
+
+def _validate_column(field_name: str, validator: Validator, column: Sequence[Any]) -> Sequence[Any]:
+    """
+    Validates the values of a field, converting the whole column at once when it only holds numbers.
+    """
+    typecode = None
+    if isinstance(validator, ScalarValidator):
+        typecode = _TYPECODES.get(validator.field_type)
+
+    # Only lists and tuples, as an array built from bytes or another array takes their raw machine values instead.
+    if typecode is not None and type(column) in (list, tuple):
+        try:
+            return array(typecode, column)
+        except (TypeError, OverflowError):
+            pass
+
+    validate = validator.validate
+    try:
+        values = [validate(index, item) for index, item in enumerate(column)]
+    except ValidationError as ex:
+        raise ValidationError(None, field_name, ex.value, ex) from None
+
+    if typecode is not None:
+        try:
+            return array(typecode, values)
+        except OverflowError:
+            pass
+
+    return values
+
+
+def validate_columns(cls: type, data: Mapping[str, Sequence[Any]]) -> Frame:
+    """
+    Validates column-oriented data, applying the validator of each field to its whole column.
+
+    :param cls: The model class.
+    :param data: The columns, by field name.
+    :return: The frame.
+    """
+    length = None
+    for field_name, column in data.items():
+        if length is None:
+            length = len(column)
+        elif len(column) != length:
+            raise ValidationError(
+                f"Column '{field_name}' has {len(column)} values, expected {length}", field_name, column
+            )
+
+    if length is None:
+        length = 0
+
+    # Slotted models only serve their defaults through instances.
+    instance = cls.__new__(cls)
+    columns = {}
+    for field_name, field_type, validator in cls.__fields__:
+        if field_name in data:
+            columns[field_name] = _validate_column(field_name, validator, data[field_name])
+        elif hasattr(instance, field_name):
+            # The same as a missing keyword argument of `__init__`.
+            columns[field_name] = [validator.validate(field_name, None)] * length
+        else:
+            raise RequiredFieldError(field_name, field_type, None)
+
+    return Frame(cls, columns, length)
@@ -0,0 +1,101 @@
+# Copyright 2025 Dhiego Cassiano Fogaça Barbosa
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Self
+
+
+class ModelConfig:
+    """
+    The options of a model class, given as class keywords and inherited by subclasses.
+    """
+
+    __slots__ = (
+        "cache_size",
+        "codegen",
+        "collect_errors",
+        "frozen",
+        "lazy",
+        "max_errors",
+        "passthrough",
+        "passthrough_copy",
+        "passthrough_subclasses",
+        "validate_assignment",
+    )
+
+    def __init__(
+        self,
+        cache_size: int = 0,
+        codegen: bool = False,
+        collect_errors: bool = False,
+        frozen: bool = False,
+        lazy: bool = False,
+        max_errors: int = 100,
+        passthrough: bool = True,
+        passthrough_copy: bool = False,
+        passthrough_subclasses: bool = False,
+        validate_assignment: bool = False,
+    ) -> None:
+        """
+
+        :param cache_size: Keeps the models built from the last `cache_size` distinct inputs in an LRU cache, and
+            returns them for repeated inputs without validating them again. Only frozen models can be cached, as the
+            instances are shared.
+        :param codegen: Generates and `exec`s a specialized `__init__` for the model. The compiled code can be cached on
+            disk with `enable_schema_cache`.
+        :param collect_errors: When validation fails, validates every field and nested item to raise an
+            `AggregateError` holding all the errors, instead of only the first one. Valid inputs take the same path as
+            without it. Ignored by lazy models.
+        :param frozen: Prevents changing the fields after `__init__`, and makes the model hashable, comparing and
+            hashing it field by field. The hash is computed once per instance, and lists are stored as tuples. Fields
+            holding dicts, arrays, unhashable classes such as a bare `set`, or models that aren't frozen are rejected,
+            as they can't be hashed.
+        :param lazy: Only checks that the required fields are present on `__init__`, validating each field on its first
+            access instead. Takes precedence over `codegen`, and can't be combined with `slots`.
+        :param max_errors: The maximum number of errors collected with `collect_errors`, bounding the cost of inputs
+            with many invalid items.
+        :param passthrough: Accepts existing instances of the model as-is in fields annotated with it, instead of
+            validating them again.
+        :param passthrough_copy: Stores a shallow copy of the accepted instances instead.
+        :param passthrough_subclasses: Also accepts instances of subclasses of the model.
+        :param validate_assignment: Validates the values assigned to the fields after `__init__`, with the validator of
+            the assigned field only.
+        """
+        self.cache_size = cache_size
+        self.codegen = codegen
+        self.collect_errors = collect_errors
+        self.frozen = frozen
+        self.lazy = lazy
+        self.max_errors = max_errors
+        self.passthrough = passthrough
+        self.passthrough_copy = passthrough_copy
+        self.passthrough_subclasses = passthrough_subclasses
+        self.validate_assignment = validate_assignment
+
+    def replace(self, **changes: Any) -> Self:
+        """
+        Creates a copy of the config with some options changed.
+
+        :param changes: The options to change.
+        :return: The new config.
+        """
+        config = self.__class__.__new__(self.__class__)
+        for option in self.__slots__:
+            setattr(config, option, changes.get(option, getattr(self, option)))
+
+        return config
+
+    def __repr__(self) -> str:
+        options = [f"{option}={getattr(self, option)!r}" for option in self.__slots__]
+
+        return f"{self.__class__.__name__}({', '.join(options)})"
@@ -0,0 +1,163 @@
+# Copyright 2025 Dhiego Cassiano Fogaça Barbosa
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Callable
+from enum import Enum
+from json import JSONEncoder
+from json.encoder import c_make_encoder, encode_basestring
+from types import NoneType
+from typing import Any
+
+from polymathes.validators import (
+    DictValidator,
+    DiscriminatedUnionValidator,
+    EnumValidator,
+    FrozenListValidator,
+    ListValidator,
+    LiteralValidator,
+    ModelValidator,
+    TupleValidator,
+    UnionValidator,
+    Validator,
+)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _dump_model(value: Any) -> dict:
+    return value.dump()
+
+
+def _dump_enum(value: Enum) -> str:
+    return value.name
+
+
+def _dump_list(value: list) -> list:
+    return [dump_value(item) for item in value]
+
+
+def _dump_tuple(value: tuple) -> tuple:
+    return tuple([dump_value(item) for item in value])
+
+
+def _dump_dict(value: dict) -> dict:
+    return {dump_value(key): dump_value(item) for key, item in value.items()}
+
+
+# Dump functions by the exact type of the value, filled as new types are seen.
+_dumpers: dict[type, Callable[[Any], Any]] = {
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    NoneType: _identity,
+    list: _dump_list,
+    tuple: _dump_tuple,
+    dict: _dump_dict,
+}
+
+
+def _resolve_dumper(value_type: type) -> Callable[[Any], Any]:
+    from polymathes.models import BaseModel
+
+    if issubclass(value_type, BaseModel):
+        dumper = _dump_model
+    elif issubclass(value_type, Enum):
+        dumper = _dump_enum
+    elif issubclass(value_type, list):
+        dumper = _dump_list
+    elif issubclass(value_type, tuple):
+        dumper = _dump_tuple
+    elif issubclass(value_type, dict):
+        dumper = _dump_dict
+    else:
+        dumper = _identity
+
+    _dumpers[value_type] = dumper
+
+    return dumper
+
+
+def dump_value(value: Any) -> Any:
+    """
+    Dumps a value recursively: models become dicts and enum members their name, which validation accepts back.
+
+    :param value: The value.
+    :return: The dumped value.
+    """
+    try:
+        dumper = _dumpers[type(value)]
+    except KeyError:
+        dumper = _resolve_dumper(type(value))
+
+    return dumper(value)
+
+
+def _needs_dump(validator: Validator, models: bool) -> bool:
+    """
+    Checks if the values accepted by a validator may hold enum members, or models.
+    """
+    if isinstance(validator, EnumValidator):
+        return True
+
+    if isinstance(validator, ModelValidator | DiscriminatedUnionValidator):
+        return models
+
+    if isinstance(validator, LiteralValidator):
+        return any(isinstance(literal, Enum) for literal in validator.values.values())
+
+    if isinstance(validator, ListValidator | FrozenListValidator):
+        return _needs_dump(validator.item, models)
+
+    if isinstance(validator, TupleValidator):
+        return any(_needs_dump(item, models) for item in validator.items)
+
+    if isinstance(validator, DictValidator):
+        return _needs_dump(validator.key, models) or _needs_dump(validator.value, models)
+
+    if isinstance(validator, UnionValidator):
+        return any(_needs_dump(option, models) for option in validator.options)
+
+    return False
+
+
+def compile_dumpers(
+    fields: tuple[tuple[str, Any, Validator], ...],
+    models: bool = True,
+) -> tuple[tuple[str, Callable[[Any], Any]], ...]:
+    """
+    Selects the fields of a model whose values have to be dumped, leaving the rest as-is.
+
+    :param fields: The compiled fields of the model.
+    :param models: Selects the fields that may hold models too, not only enum members.
+    :return: The name and the dump function of each of those fields.
+    """
+    return tuple((field_name, dump_value) for field_name, _, validator in fields if _needs_dump(validator, models))
+
+
+def make_json_encoder(default: Callable[[Any], Any]) -> Callable[[Any], str]:
+    """
+    Creates a compact JSON encoder, using the C encoder directly when available to skip the setup of `json.dumps`.
+
+    :param default: Converts the values that aren't JSON types.
+    :return: The encoder.
+    """
+    if c_make_encoder is None:
+        return JSONEncoder(check_circular=False, ensure_ascii=False, separators=(",", ":"), default=default).encode
+
+    encode = c_make_encoder(None, default, encode_basestring, None, ":", ",", False, False, True)
+
+    return lambda value: "".join(encode(value, 0))
@@ -18,29 +18,88 @@ from typing import Any, Self
 class ValidationError(Exception):
     """
     Represents a validation error.
+
+    Only the data of the error is stored when it is raised; the message and the path are built on first access, as
+    most errors raised by nested validators are caught and discarded or wrapped. `args` holds the message, as with the
+    other exceptions.
     """
 
+    __slots__ = ("field_name", "value", "base_ex", "_message", "_path")
+
     def __init__(
         self,
-        message: str,
-        field_name: str,
+        message: str | None,
+        field_name: int | str,
         value: Any,
         base_ex: Self | None = None,
     ) -> None:
         """
 
-        :param message: The error message.
+        :param message: The error message, or None to use the message of the base exception.
         :param field_name: The name of the field.
         :param value: The value of the field.
         :param base_ex: The base exception.
         """
-        super().__init__(message)
+        super().__init__()
+        self._message = message
+        self._path = None
         self.field_name = field_name
         self.value = value
         self.base_ex = base_ex
 
+    @property
+    def message(self) -> str:
+        """
+        The error message.
+        """
+        if self._message is None:
+            self._message = self._format()
+
+        return self._message
+
+    @property
+    def args(self) -> tuple[str]:
+        return (self.message,)
+
+    @args.setter
+    def args(self, args: tuple) -> None:
+        self._message = str(args[0]) if args else ""
+
+    @property
+    def path(self) -> tuple[int | str, ...]:
+        """
+        The field names and indexes from the outermost value to the invalid one, such as `("items", 2, "price")`.
+        """
+        if self._path is None:
+            path = []
+            ex = self
+            while ex is not None:
+                path.append(ex.field_name)
+                ex = ex.base_ex
+
+            self._path = tuple(path)
+
+        return self._path
+
+    def _format(self) -> str:
+        return self.base_ex.message if self.base_ex is not None else ""
+
     def get_full_field_name(self) -> str:
-        return str(self.field_name) + ("." + self.base_ex.get_full_field_name() if self.base_ex else "")
+        return ".".join(map(str, self.path))
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __reduce__(self) -> tuple:
+        # The default reduction calls `cls(*self.args)` and doesn't include the slots.
+        state = {
+            slot: getattr(self, slot)
+            for klass in type(self).__mro__
+            for slot in klass.__dict__.get("__slots__", ())
+            if hasattr(self, slot)
+        }
+
+        return _restore, (self.__class__, state)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}: {self}"
@@ -51,16 +110,21 @@ class UnexpectedTypeError(ValidationError):
     Raised when a field has an unexpected type.
     """
 
+    __slots__ = ("field_type",)
+
     def __init__(
         self,
-        field_name: str,
+        field_name: int | str,
         field_type: type,
         value: Any,
         base_ex: Self | None = None,
     ) -> None:
-        super().__init__(f"Expected {field_type}, got {type(value)}", field_name, value, base_ex)
+        super().__init__(None, field_name, value, base_ex)
         self.field_type = field_type
 
+    def _format(self) -> str:
+        return f"Expected {self.field_type}, got {type(self.value)}"
+
     def __repr__(self) -> str:
         return super().__repr__() + f"\n'{self.get_full_field_name()}': {self.value}"
 
@@ -70,11 +134,83 @@ class RequiredFieldError(ValidationError):
     Raised when a required field is missing.
     """
 
+    __slots__ = ("field_type",)
+
     def __init__(
         self,
         field_name: str,
         field_type: type,
         base_ex: Self | None = None,
     ) -> None:
-        super().__init__(f"Field '{field_name}': {field_type} is required", field_name, None, base_ex)
+        super().__init__(None, field_name, None, base_ex)
         self.field_type = field_type
+
+    def _format(self) -> str:
+        return f"Field '{self.field_name}': {self.field_type} is required"
+
+
+class AggregateError(ValidationError):
+    """
+    Raised by models with `collect_errors=True`, holding every error found instead of only the first one.
+
+    Its field name, value and path are the ones of the first error, so it can be handled as a single error too.
+    """
+
+    __slots__ = ("errors", "truncated")
+
+    def __init__(self, errors: list[ValidationError], truncated: bool = False) -> None:
+        """
+
+        :param errors: The errors, each one with its full path from the model.
+        :param truncated: If more than `max_errors` errors were found, so only the first ones are kept.
+        """
+        first = errors[0]
+        super().__init__(None, first.field_name, first.value, first.base_ex)
+        self.errors = errors
+        self.truncated = truncated
+
+    def _format(self) -> str:
+        count = f"{len(self.errors)}{'+' if self.truncated else ''}"
+        lines = [f"{count} validation errors"]
+        lines.extend(f"  {ex.get_full_field_name()}: {ex.message}" for ex in self.errors)
+
+        return "\n".join(lines)
+
+
+class LineError(ValidationError):
+    """
+    Raised when a record of a JSON Lines input is invalid.
+    """
+
+    __slots__ = ("line_number", "offset")
+
+    def __init__(
+        self,
+        line_number: int,
+        offset: int,
+        line: bytes,
+        message: str | None,
+        base_ex: ValidationError | None = None,
+    ) -> None:
+        """
+
+        :param line_number: The number of the line, starting at 1.
+        :param offset: The offset of the start of the line, in bytes.
+        :param line: The raw line.
+        :param message: The error message, or None to use the message of the validation error.
+        :param base_ex: The validation error of the record, if it is valid JSON.
+        """
+        super().__init__(message, line_number, line, base_ex)
+        self.line_number = line_number
+        self.offset = offset
+
+
+def _restore(cls: type[ValidationError], state: dict) -> ValidationError:
+    """
+    Rebuilds a pickled `ValidationError` without calling its constructor.
+    """
+    ex = cls.__new__(cls)
+    for name, value in state.items():
+        setattr(ex, name, value)
+
+    return ex
@@ -0,0 +1,86 @@
+# Copyright 2025 Dhiego Cassiano Fogaça Barbosa
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from contextlib import suppress
+from typing import Any
+
+from polymathes.assignment import store
+
+# The attribute caching the hash of a frozen model, which is also a slot of slotted frozen models.
+HASH = "__polymathes_hash__"
+
+
+def frozen_setattr(self: Any, name: str, value: Any) -> None:
+    raise AttributeError(f"'{type(self).__name__}' object is frozen, can't set '{name}'")
+
+
+def frozen_delattr(self: Any, name: str) -> None:
+    raise AttributeError(f"'{type(self).__name__}' object is frozen, can't delete '{name}'")
+
+
+def frozen_eq(self: Any, other: Any) -> bool:
+    """
+    Compares two frozen models of the same class field by field.
+    """
+    if self is other:
+        return True
+
+    if type(other) is not type(self):
+        return NotImplemented
+
+    # Cheaper than comparing the fields, when both hashes were already computed.
+    self_hash = getattr(self, HASH, None)
+    if self_hash is not None and self_hash != getattr(other, HASH, self_hash):
+        return False
+
+    return all(getattr(self, field_name) == getattr(other, field_name) for field_name, _, _ in self.__fields__)
+
+
+def frozen_hash(self: Any) -> int:
+    """
+    Hashes the fields of a frozen model, computing the hash only once per instance.
+    """
+    try:
+        return object.__getattribute__(self, HASH)
+    except AttributeError:
+        pass
+
+    value = hash(tuple([getattr(self, field_name) for field_name, _, _ in self.__fields__]))
+    store(self, HASH, value)
+
+    return value
+
+
+def frozen_getstate(self: Any) -> dict[str, Any]:
+    """
+    Returns the attributes of a frozen model to pickle or copy, without the cached hash, which depends on the hash seed
+    of the process.
+    """
+    state = dict(getattr(self, "__dict__", {}))
+    for klass in type(self).__mro__:
+        for slot in klass.__dict__.get("__slots__", ()):
+            with suppress(AttributeError):
+                state[slot] = object.__getattribute__(self, slot)
+
+    state.pop(HASH, None)
+
+    return state
+
+
+def frozen_setstate(self: Any, state: dict[str, Any]) -> None:
+    """
+    Restores the attributes of an unpickled or copied frozen model, without going through its `__setattr__`.
+    """
+    for name, value in state.items():
+        store(self, name, value)
@@ -0,0 +1,158 @@
+# Copyright 2025 Dhiego Cassiano Fogaça Barbosa
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import mmap
+import os
+from collections.abc import Iterator
+from json import JSONDecoder
+from json.decoder import WHITESPACE
+from typing import Any, BinaryIO
+
+from polymathes.batch import model_builder
+from polymathes.errors import LineError, ValidationError
+
+_decoder = JSONDecoder()
+
+
+def iter_blocks(source: str | os.PathLike | BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    """
+    Reads the input in blocks made of whole lines.
+
+    Paths are memory-mapped; file objects are read `chunk_size` bytes at a time. A block is only larger than
+    `chunk_size` when a single line is.
+
+    :param source: A path or a binary file object.
+    :param chunk_size: The size of the blocks, in bytes.
+    :return: The blocks.
+    """
+    if isinstance(source, str | os.PathLike):
+        with open(source, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if not size:
+                return
+
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                start = 0
+                while start < size:
+                    end = mapped.rfind(b"\n", start, start + chunk_size) + 1
+                    if end <= start:
+                        end = mapped.find(b"\n", start + chunk_size) + 1 or size
+
+                    yield mapped[start:end]
+                    start = end
+
+        return
+
+    read = source.read
+    rest = b""
+    while chunk := read(chunk_size):
+        end = chunk.rfind(b"\n") + 1
+        if not end:
+            rest += chunk
+            continue
+
+        yield rest + chunk[:end] if rest else chunk[:end]
+        rest = chunk[end:]
+
+    if rest:
+        yield rest
+
+
+def iter_jsonl(
+    cls: type,
+    source: str | os.PathLike | BinaryIO,
+    errors: list[LineError] | None,
+    chunk_size: int,
+) -> Iterator[Any]:
+    """
+    Validates each line of a JSON Lines input into a model.
+
+    Each block is decoded once and the records are parsed in place, so lines are only copied when they are invalid.
+    Blank lines are skipped.
+
+    :param cls: The model class.
+    :param source: A path or a binary file object.
+    :param errors: If given, receives the errors of invalid lines instead of raising the first one.
+    :param chunk_size: The size of the blocks read at a time, in bytes.
+    :return: The models.
+    """
+    builder = model_builder(cls)
+    decode = _decoder.raw_decode
+    skip = WHITESPACE.match
+    line_number = 0
+    block_offset = 0
+
+    for block in iter_blocks(source, chunk_size):
+        try:
+            text = block.decode()
+        except UnicodeDecodeError:
+            text = None
+
+        size = len(block)
+        byte_start = 0
+        char_start = 0
+
+        while byte_start < size:
+            line_number += 1
+            byte_end = block.find(b"\n", byte_start)
+            if byte_end == -1:
+                byte_end = size
+
+            try:
+                if text is not None:
+                    line, start = text, char_start
+                    end = text.find("\n", char_start)
+                    if end == -1:
+                        end = len(text)
+                    char_start = end + 1
+                else:
+                    line = block[byte_start:byte_end].decode()
+                    start, end = 0, len(line)
+
+                start = skip(line, start).end()
+                if start < end:
+                    try:
+                        data, stop = decode(line, start)
+                    except ValueError:
+                        stop = None
+
+                    if stop is None or stop > end:
+                        # The record is invalid or continues on the next lines: decodes the line alone, so the error
+                        # (and the position it reports) doesn't depend on the block the line was read in.
+                        line = block[byte_start:byte_end].decode()
+                        start, end = skip(line).end(), len(line)
+                        data, stop = decode(line, start)
+
+                    if skip(line, stop).end() < end:
+                        raise ValueError("Extra data after the record")
+
+                    model = builder(data)
+                else:
+                    model = None
+            except ValidationError as ex:
+                model = LineError(line_number, block_offset + byte_start, block[byte_start:byte_end], None, ex)
+            except (ValueError, TypeError) as ex:
+                model = LineError(line_number, block_offset + byte_start, block[byte_start:byte_end], str(ex))
+
+            byte_start = byte_end + 1
+
+            if type(model) is LineError:
+                if errors is None:
+                    raise model
+
+                errors.append(model)
+            elif model is not None:
+                yield model
+
+        block_offset += size
@@ -0,0 +1,535 @@
+# Copyright 2025 Dhiego Cassiano Fogaça Barbosa
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Callable
+from json import JSONDecodeError, JSONDecoder
+from json.decoder import WHITESPACE, scanstring
+from json.scanner import make_scanner
+from typing import Any
+
+from polymathes.aggregate import collect_model_errors
+from polymathes.assignment import assignment_init, store
+from polymathes.errors import RequiredFieldError, UnexpectedTypeError, ValidationError
+from polymathes.validators import (
+    INVALID,
+    DictValidator,
+    DiscriminatedUnionValidator,
+    FrozenListValidator,
+    ListValidator,
+    ModelValidator,
+    TupleValidator,
+    UnionValidator,
+    Validator,
+    WrapperValidator,
+)
+
+_scan_once = make_scanner(JSONDecoder())
+_skip = WHITESPACE.match
+
+# Parses and validates the JSON value at an index (with no leading whitespace), for a field name, returning the
+# validated value and the index after it.
+_Parser = Callable[[str, int, int | str], tuple[Any, int]]
+
+
+def _scan(s: str, idx: int) -> tuple[Any, int]:
+    """
+    Decodes a single JSON value with the C scanner.
+
+    :param s: The document.
+    :param idx: The index of the value.
+    :return: The value and the index after it.
+    """
+    try:
+        return _scan_once(s, idx)
+    except StopIteration as ex:
+        raise JSONDecodeError("Expecting value", s, ex.value) from None
+
+
+def _uses_default_init(cls: type) -> bool:
+    from polymathes.models import BaseModel
+
+    init = cls.__init__
+    return (
+        init is BaseModel.__init__
+        or init is assignment_init
+        or getattr(init, "__polymathes_codegen__", False)
+        or getattr(init, "__polymathes_default_init__", False)
+    ) and cls.__new__ is object.__new__
+
+
+class _Plan:
+    """
+    The parsers of the fields of a model, built on its first `validate_json` and stored on the class.
+    """
+
+    __slots__ = ("fields", "parsers", "structured")
+
+    def __init__(self, cls: type, building: tuple[type, ...]) -> None:
+        """
+
+        :param cls: The model class.
+        :param building: The models whose plan is being built, to stop at recursive references.
+        """
+        # Compared with the current fields of the model, to build the plan again when they are replaced.
+        self.fields = cls.__fields__
+        self.parsers: dict[str, _Parser] = {}
+        self.structured = False
+
+        for field_name, _, validator in self.fields:
+            parser = _compile(validator, building)
+            if parser is None:
+                parser = _scanner(validator)
+            else:
+                self.structured = True
+
+            self.parsers[field_name] = parser
+
+
+def _plan(cls: type, building: tuple[type, ...] = ()) -> _Plan:
+    plan = cls.__dict__.get("__json_plan__")
+    if plan is None or plan.fields is not cls.__fields__:
+        plan = _Plan(cls, (*building, cls))
+        cls.__json_plan__ = plan
+
+    return plan
+
+
+def _compile(validator: Validator, building: tuple[type, ...]) -> _Parser | None:
+    """
+    Builds the parser of a validator that should parse its value directly, rather than decoding the whole value first.
+
+    That is the case of tuples (which JSON represents as arrays), and of models, containers and unions holding tuples.
+
+    :param validator: The validator.
+    :param building: The models whose plan is being built.
+    :return: The parser, or None if the value can be decoded by the C scanner and then validated.
+    """
+    if isinstance(validator, TupleValidator):
+        items = tuple(_compile(item, building) or _scanner(item) for item in validator.items)
+
+        return _tuple_parser(validator, items)
+
+    if isinstance(validator, ListValidator | FrozenListValidator):
+        item = _compile(validator.item, building)
+
+        return _list_parser(validator, item) if item is not None else None
+
+    if isinstance(validator, DictValidator):
+        value = _compile(validator.value, building)
+
+        return _dict_parser(validator, value) if value is not None else None
+
+    if isinstance(validator, ModelValidator):
+        # Models made only of scalars are decoded by the C scanner, which is faster than parsing them here. Recursive
+        # references are assumed to be structured, as their plan isn't known yet.
+        model = validator.field_type
+        if model not in building and not _plan(model, building).structured:
+            return None
+
+        return _model_parser(validator)
+
+    if isinstance(validator, WrapperValidator):
+        # Parsing in place would skip the wrapper, so the value is decoded first.
+        return _converter(validator) if _compile(validator.validator, building) is not None else None
+
+    if isinstance(validator, UnionValidator | DiscriminatedUnionValidator):
+        options = validator.options if isinstance(validator, UnionValidator) else validator.models.values()
+        if all(_compile(option, building) is None for option in options):
+            return None
+
+        # The option is only known after trying them, so the value is decoded first.
+        return _converter(validator)
+
+    return None
+
+
+def _scanner(validator: Validator) -> _Parser:
+    """
+    Builds a parser decoding the value with the C scanner, then validating it.
+    """
+    validate = validator.validate
+
+    def parse(s: str, idx: int, field_name: int | str) -> tuple[Any, int]:
+        value, idx = _scan(s, idx)
+
+        return validate(field_name, value), idx
+
+    return parse
+
+
+def _converter(validator: Validator) -> _Parser:
+    """
+    Builds a parser decoding the value with the C scanner, then validating it with its arrays converted to tuples where
+    the validator expects them.
+    """
+    validate = validator.validate
+
+    def parse(s: str, idx: int, field_name: int | str) -> tuple[Any, int]:
+        value, idx = _scan(s, idx)
+
+        return validate(field_name, _from_json(validator, value)), idx
+
+    return parse
+
+
+def _from_json(validator: Validator, value: Any) -> Any:
+    """
+    Converts a decoded JSON value for a validator, turning the arrays it expects as tuples into tuples, at any depth.
+
+    :param validator: The validator.
+    :param value: The decoded value.
+    :return: The converted value, or the value itself if nothing needs converting.
+    """
+    value_type = type(value)
+
+    if isinstance(validator, WrapperValidator):
+        return _from_json(validator.validator, value)
+
+    if isinstance(validator, TupleValidator) and value_type is list:
+        if validator.variadic:
+            return tuple([_from_json(validator.items[0], item) for item in value])
+
+        if len(value) != len(validator.items):
+            return tuple(value)
+
+        return tuple([_from_json(item, item_value) for item, item_value in zip(validator.items, value, strict=True)])
+
+    if isinstance(validator, ListValidator | FrozenListValidator) and value_type is list:
+        return [_from_json(validator.item, item) for item in value]
+
+    if isinstance(validator, DictValidator) and value_type is dict:
+        return {key: _from_json(validator.value, item) for key, item in value.items()}
+
+    if isinstance(validator, ModelValidator):
+        return _model_from_json(validator.field_type, value)
+
+    if isinstance(validator, DiscriminatedUnionValidator) and value_type is dict:
+        try:
+            option = validator.models[type(value[validator.tag]), value[validator.tag]]
+        except (KeyError, TypeError):
+            return value
+
+        return _from_json(option, value)
+
+    if isinstance(validator, UnionValidator) and validator.try_validate(0, value) is INVALID:
+        # Arrays are only converted when no option accepts them as they are, as with `json.loads`.
+        for option in validator.options:
+            converted = _from_json(option, value)
+            if converted is not value and option.try_validate(0, converted) is not INVALID:
+                return converted
+
+    return value
+
+
+def _model_from_json(cls: type, data: Any) -> Any:
+    """
+    Converts the arrays of a decoded JSON object for a model, the same as `_from_json`.
+    """
+    if type(data) is not dict or not _plan(cls).structured:
+        return data
+
+    fields = {field_name: validator for field_name, _, validator in cls.__fields__}
+
+    return {key: _from_json(fields[key], value) if key in fields else value for key, value in data.items()}
+
+
+def _parse_array(s: str, idx: int) -> tuple[int, bool]:
+    """
+    Moves past the opening bracket of an array.
+
+    :return: The index of the first item (or of the closing bracket) and if the array is empty.
+    """
+    idx = _skip(s, idx + 1).end()
+
+    if s[idx : idx + 1] == "]":
+        return idx + 1, True
+
+    return idx, False
+
+
+def _next_item(s: str, idx: int, end: str) -> tuple[int, bool]:
+    """
+    Moves past the separator after an item of an array or object.
+
+    :return: The index of the next item (or after the closing bracket) and if the container ended.
+    """
+    idx = _skip(s, idx).end()
+    char = s[idx : idx + 1]
+
+    if char == ",":
+        return _skip(s, idx + 1).end(), False
+
+    if char == end:
+        return idx + 1, True
+
+    raise JSONDecodeError("Expecting ',' delimiter", s, idx)
+
+
+def _parse_key(s: str, idx: int) -> tuple[str, int]:
+    """
+    Parses an object key along with the colon after it.
+
+    :return: The key and the index of its value.
+    """
+    if s[idx : idx + 1] != '"':
+        raise JSONDecodeError("Expecting property name enclosed in double quotes", s, idx)
+
+    key, idx = scanstring(s, idx + 1)
+    idx = _skip(s, idx).end()
+
+    if s[idx : idx + 1] != ":":
+        raise JSONDecodeError("Expecting ':' delimiter", s, idx)
+
+    return key, _skip(s, idx + 1).end()
+
+
+def _is_repeated(s: str, idx: int, key: str) -> bool:
+    """
+    Checks if a key appears again in the rest of an object.
+
+    JSON keeps the last value of a repeated key, so the errors of the previous values are ignored, as with `json.loads`.
+    Malformed documents are treated as not repeating the key, so the validation error still comes first.
+
+    :param s: The document.
+    :param idx: The index of the value of the key.
+    :param key: The key.
+    """
+    try:
+        _, idx = _scan(s, idx)
+        idx, done = _next_item(s, idx, "}")
+
+        while not done:
+            other, idx = _parse_key(s, idx)
+            if other == key:
+                return True
+
+            _, idx = _scan(s, idx)
+            idx, done = _next_item(s, idx, "}")
+    except JSONDecodeError:
+        pass
+
+    return False
+
+
+def _list_parser(validator: ListValidator | FrozenListValidator, item: _Parser) -> _Parser:
+    fallback = _scanner(validator)
+    frozen = isinstance(validator, FrozenListValidator)
+
+    def parse(s: str, idx: int, field_name: int | str) -> tuple[Any, int]:
+        if s[idx : idx + 1] != "[":
+            return fallback(s, idx, field_name)
+
+        result = []
+        idx, done = _parse_array(s, idx)
+
+        try:
+            while not done:
+                value, idx = item(s, idx, len(result))
+                result.append(value)
+                idx, done = _next_item(s, idx, "]")
+        except ValidationError as ex:
+            raise ValidationError(None, field_name, ex.value, ex) from None
+
+        return tuple(result) if frozen else result, idx
+
+    return parse
+
+
+def _tuple_parser(validator: TupleValidator, items: tuple[_Parser, ...]) -> _Parser:
+    fallback = _scanner(validator)
+
+    def parse(s: str, idx: int, field_name: int | str) -> tuple[Any, int]:
+        if s[idx : idx + 1] != "[":
+            return fallback(s, idx, field_name)
+
+        start = idx
+        result = []
+        idx, done = _parse_array(s, idx)
+
+        try:
+            while not done:
+                if validator.variadic:
+                    item = items[0]
+                elif len(result) < len(items):
+                    item = items[len(result)]
+                else:
+                    # Too many items, reported along with the whole array.
+                    break
+
+                value, idx = item(s, idx, len(result))
+                result.append(value)
+                idx, done = _next_item(s, idx, "]")
+        except ValidationError as ex:
+            raise ValidationError(None, field_name, ex.value, ex) from None
+
+        if not done or (not validator.variadic and len(result) != len(items)):
+            value, idx = _scan(s, start)
+            ex = UnexpectedTypeError(field_name, validator.field_type, tuple(value))
+            raise ValidationError(None, field_name, ex.value, ex)
+
+        return tuple(result), idx
+
+    return parse
+
+
+def _dict_parser(validator: DictValidator, item: _Parser) -> _Parser:
+    fallback = _scanner(validator)
+    validate_key = validator.key.validate
+
+    def parse(s: str, idx: int, field_name: int | str) -> tuple[Any, int]:
+        if s[idx : idx + 1] != "{":
+            return fallback(s, idx, field_name)
+
+        result = {}
+        idx = _skip(s, idx + 1).end()
+        done = s[idx : idx + 1] == "}"
+        if done:
+            idx += 1
+
+        try:
+            while not done:
+                raw_key, idx = _parse_key(s, idx)
+                key = validate_key(raw_key, raw_key)
+
+                start = idx
+                try:
+                    value, idx = item(s, idx, key)
+                except ValidationError:
+                    if not _is_repeated(s, start, raw_key):
+                        # Values are reported with the value itself as the field name, like `DictValidator`, which
+                        # requires decoding it and parsing it again.
+                        name, _ = _scan(s, start)
+                        item(s, start, name)
+                        raise
+
+                    _, idx = _scan(s, start)
+                else:
+                    result[key] = value
+
+                idx, done = _next_item(s, idx, "}")
+        except ValidationError as ex:
+            raise ValidationError(None, field_name, ex.value, ex) from None
+
+        return result, idx
+
+    return parse
+
+
+def _model_parser(validator: ModelValidator) -> _Parser:
+    model = validator.field_type
+    fallback = _converter(validator)
+
+    def parse(s: str, idx: int, field_name: int | str) -> tuple[Any, int]:
+        if s[idx : idx + 1] != "{" or not _uses_default_init(model):
+            return fallback(s, idx, field_name)
+
+        try:
+            return _parse_model(model, s, idx)
+        except ValidationError as ex:
+            raise ValidationError(None, field_name, ex.value, ex) from None
+
+    return parse
+
+
+def _parse_model(cls: type, s: str, idx: int) -> tuple[Any, int]:
+    """
+    Parses a JSON object straight into a model using the default `__init__`.
+
+    Fields are validated in the order they appear in the document, so the first error may differ from the one of
+    `cls(**json.loads(s))` when several fields are invalid. Models with `collect_errors=True` report every error, the
+    same as `cls(**json.loads(s))`.
+    """
+    try:
+        return _parse_fields(cls, s, idx)
+    except ValidationError as ex:
+        if not cls.__config__.collect_errors:
+            raise
+
+        try:
+            data, _ = _scan(s, idx)
+        except JSONDecodeError:
+            # The rest of the document is malformed, so only the first error is known.
+            raise ex from None
+
+        raise collect_model_errors(cls, _model_from_json(cls, data), ex) from None
+
+
+def _parse_fields(cls: type, s: str, idx: int) -> tuple[Any, int]:
+    plan = _plan(cls)
+    parsers = plan.parsers
+    values = {}
+
+    idx = _skip(s, idx + 1).end()
+    done = s[idx : idx + 1] == "}"
+    if done:
+        idx += 1
+
+    while not done:
+        key, idx = _parse_key(s, idx)
+
+        parser = parsers.get(key)
+        if parser is None:
+            _, idx = _scan(s, idx)
+        else:
+            start = idx
+            try:
+                values[key], idx = parser(s, idx, key)
+            except ValidationError:
+                if not _is_repeated(s, start, key):
+                    raise
+
+                _, idx = _scan(s, start)
+
+        idx, done = _next_item(s, idx, "}")
+
+    self = object.__new__(cls)
+    for field_name, field_type, validator in plan.fields:
+        if field_name in values:
+            value = values[field_name]
+        elif hasattr(self, field_name):
+            value = validator.validate(field_name, None)
+        else:
+            raise RequiredFieldError(field_name, field_type, None)
+
+        # The values are already validated, and frozen models have no `__setattr__`.
+        store(self, field_name, value)
+
+    return self, idx
+
+
+def validate_json(cls: type, data: str | bytes | bytearray | memoryview) -> Any:
+    """
+    Parses and validates a JSON document into a model in one pass.
+
+    The buffer is decoded as UTF-8 directly, without copying it first. JSON arrays are accepted for tuple fields, also
+    by models with their own `__init__`, which are built from the decoded document.
+
+    :param cls: The model class.
+    :param data: The JSON document.
+    :return: The model.
+    """
+    s = data if isinstance(data, str) else str(data, "utf-8")
+    idx = _skip(s, 0).end()
+
+    if s[idx : idx + 1] == "{" and _uses_default_init(cls):
+        model, idx = _parse_model(cls, s, idx)
+    else:
+        value, idx = _scan(s, idx)
+        model = cls(**_model_from_json(cls, value))
+
+    idx = _skip(s, idx).end()
+    if idx != len(s):
+        raise JSONDecodeError("Extra data", s, idx)
+
+    return model
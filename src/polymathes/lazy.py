@@ -0,0 +1,87 @@
+# Copyright 2025 Dhiego Cassiano Fogaça Barbosa
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any
+
+from polymathes.errors import RequiredFieldError
+from polymathes.validators import Validator
+
+# The key of the instance `__dict__` holding the values not validated yet.
+RAW = "__polymathes_raw__"
+
+
+class LazyField:
+    """
+    Validates a field of a lazy model on first access.
+
+    This is a non-data descriptor: the validated value is stored in the instance `__dict__`, which takes precedence on
+    the following accesses.
+    """
+
+    __slots__ = ("field_name", "field_type", "validator", "has_default", "default")
+
+    def __init__(self, field_name: str, field_type: Any, validator: Validator, owner: type) -> None:
+        """
+
+        :param field_name: The name of the field.
+        :param field_type: The annotation of the field.
+        :param validator: The validator of the field.
+        :param owner: The model class, before the descriptor replaces its class-level default.
+        """
+        self.field_name = field_name
+        self.field_type = field_type
+        self.validator = validator
+        self.has_default = hasattr(owner, field_name)
+        self.default = getattr(owner, field_name, None)
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            if self.has_default:
+                return self.default
+
+            raise AttributeError(f"type object '{owner.__name__}' has no attribute '{self.field_name}'")
+
+        try:
+            value = instance.__dict__[RAW][self.field_name]
+        except KeyError:
+            # Not set by `__init__`, as with `construct`.
+            if self.has_default:
+                return self.default
+
+            raise AttributeError(f"'{type(instance).__name__}' object has no attribute '{self.field_name}'") from None
+
+        value = self.validator.validate(self.field_name, value)
+        instance.__dict__[self.field_name] = value
+        # Another thread may have validated it meanwhile, and already removed the raw value.
+        instance.__dict__[RAW].pop(self.field_name, None)
+
+        return value
+
+
+def lazy_init(self: Any, /, **kwargs) -> None:
+    """
+    The `__init__` of lazy models, only checking that the required fields are present.
+    """
+    raw = {}
+    for field in type(self).__lazy_fields__:
+        field_name = field.field_name
+
+        if field_name in kwargs:
+            raw[field_name] = kwargs[field_name]
+        elif field.has_default:
+            raw[field_name] = None
+        else:
+            raise RequiredFieldError(field_name, field.field_type, None)
+
+    self.__dict__[RAW] = raw
@@ -0,0 +1,132 @@
+# Copyright 2025 Dhiego Cassiano Fogaça Barbosa
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping
+from threading import Lock
+from typing import Any
+
+
+def fingerprint(value: Any) -> Hashable:
+    """
+    Builds a hashable key for an input, equal for inputs that validate the same.
+
+    Scalars are tagged with their type, since `1`, `1.0` and `True` are equal but may validate differently. Floats are
+    keyed by their `repr`, since `0.0` and `-0.0` are equal but keep their sign, and are converted to different
+    strings.
+
+    :param value: The input.
+    :return: The key.
+    :raise TypeError: If the input holds unhashable values other than dicts, lists and tuples.
+    """
+    value_type = type(value)
+
+    if value_type is dict:
+        return dict, tuple([(fingerprint(key), fingerprint(item)) for key, item in value.items()])
+
+    if value_type is list or value_type is tuple:
+        return value_type, tuple([fingerprint(item) for item in value])
+
+    if value_type is float:
+        return value_type, repr(value)
+
+    hash(value)
+
+    return value_type, value
+
+
+class ModelCache:
+    """
+    A thread-safe LRU cache of validated models, keyed by the fingerprint of their input.
+
+    Inputs that can't be fingerprinted (such as sets) are validated every time, and counted as misses.
+    """
+
+    __slots__ = ("maxsize", "entries", "lock", "hits", "misses", "evictions")
+
+    def __init__(self, maxsize: int) -> None:
+        """
+
+        :param maxsize: The maximum number of models kept.
+        """
+        self.maxsize = maxsize
+        self.entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self.lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, data: Mapping[str, Any], create: Callable[[], Any]) -> Any:
+        """
+        Returns the model cached for an input, or creates it.
+
+        Models are created outside the lock, so concurrent misses on the same input may each validate it; the last one
+        is kept.
+
+        :param data: The input.
+        :param create: Validates the input into a model.
+        :return: The model.
+        """
+        try:
+            key = fingerprint(data)
+        except TypeError:
+            key = None
+
+        with self.lock:
+            if key is not None:
+                model = self.entries.get(key)
+                if model is not None:
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+
+                    return model
+
+            self.misses += 1
+
+        model = create()
+        if key is None:
+            return model
+
+        with self.lock:
+            self.entries[key] = model
+            self.entries.move_to_end(key)
+
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+        return model
+
+    def info(self) -> dict[str, int]:
+        """
+        Returns the statistics of the cache.
+
+        :return: The `hits`, `misses`, `evictions`, current `size` and `maxsize` of the cache.
+        """
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self.entries),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self) -> None:
+        """
+        Removes every model and resets the statistics.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = self.evictions = 0
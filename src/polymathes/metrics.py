@@ -0,0 +1,240 @@
+# Copyright 2025 Dhiego Cassiano Fogaça Barbosa
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Callable
+from time import perf_counter_ns
+from typing import Any
+
+from polymathes.assignment import assignment_init, bypasses_setattr
+from polymathes.codegen import generate_init
+from polymathes.errors import ValidationError
+from polymathes.models import BaseModel
+from polymathes.validators import Validator, WrapperValidator
+
+
+class Stats:
+    """
+    The counters of a model or of one of its fields.
+
+    Counters are updated without locking, so they may miss a few updates when the model is validated by several threads
+    at once.
+    """
+
+    __slots__ = ("calls", "failures", "coercions", "timings")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.failures = 0
+        # The values whose type was changed by the validation.
+        self.coercions = 0
+        # The number of validations taking less than `2 ** bucket` nanoseconds (and at least half of it), by bucket.
+        self.timings: dict[int, int] = {}
+
+    def snapshot(self, coercions: bool = True) -> dict[str, Any]:
+        snapshot: dict[str, Any] = {"calls": self.calls, "failures": self.failures}
+        if coercions:
+            snapshot["coercions"] = self.coercions
+
+        if self.timings:
+            snapshot["timings_ns"] = {1 << bucket: count for bucket, count in sorted(self.timings.items())}
+
+        return snapshot
+
+
+class InstrumentedValidator(WrapperValidator):
+    """
+    Wraps the validator of a field, counting its calls, failures and coercions.
+    """
+
+    __slots__ = ("stats",)
+
+    def __init__(self, validator: Validator, stats: Stats) -> None:
+        super().__init__(validator)
+        self.stats = stats
+
+    def validate(self, field_name: int | str, value: Any, strict: bool = False) -> Any:
+        stats = self.stats
+        stats.calls += 1
+
+        try:
+            result = self.validator.validate(field_name, value, strict)
+        except ValidationError:
+            stats.failures += 1
+            raise
+
+        if type(result) is not type(value):
+            stats.coercions += 1
+
+        return result
+
+
+class TimedValidator(InstrumentedValidator):
+    """
+    Same as `InstrumentedValidator`, also recording how long each validation takes.
+    """
+
+    __slots__ = ()
+
+    def validate(self, field_name: int | str, value: Any, strict: bool = False) -> Any:
+        timings = self.stats.timings
+        start = perf_counter_ns()
+
+        try:
+            return super().validate(field_name, value, strict)
+        finally:
+            bucket = (perf_counter_ns() - start).bit_length()
+            timings[bucket] = timings.get(bucket, 0) + 1
+
+
+def _instrument_init(init: Callable[..., None], stats: Stats) -> Callable[..., None]:
+    """
+    Wraps the `__init__` of a model, counting its calls and failures.
+    """
+
+    def __init__(self: Any, /, **kwargs) -> None:
+        stats.calls += 1
+
+        try:
+            init(self, **kwargs)
+        except ValidationError:
+            stats.failures += 1
+            raise
+
+    __init__.__qualname__ = init.__qualname__
+    __init__.__wrapped__ = init
+    # Lets `validate_json` keep building the model in one pass, from the instrumented fields.
+    __init__.__polymathes_default_init__ = (
+        init is BaseModel.__init__ or init is assignment_init or getattr(init, "__polymathes_codegen__", False)
+    )
+
+    return __init__
+
+
+class Metrics:
+    """
+    Collects per-model and per-field validation metrics of the models it is installed on.
+
+    Installing replaces the validators of the model with instrumented wrappers, and uninstalling puts the originals
+    back, so models that aren't instrumented run the exact same code as without metrics.
+
+    ```python
+    metrics = Metrics(timing=True)
+    metrics.install(Order)
+    ...
+    send(metrics.snapshot())
+    ```
+    """
+
+    def __init__(self, timing: bool = False) -> None:
+        """
+
+        :param timing: Also records a histogram of the time taken by the validation of each field.
+        """
+        self.timing = timing
+        self.models: dict[type, tuple[Stats, dict[str, Stats]]] = {}
+        self.originals: dict[type, dict[str, Any]] = {}
+
+    def install(self, model: type) -> None:
+        """
+        Starts collecting the metrics of a model.
+
+        Instances built by `construct` and fields that were validated lazily before the installation aren't counted.
+        Instances built by `validate_json` in one pass only count in the metrics of their fields, as their `__init__`
+        isn't called.
+
+        :param model: The model class.
+        """
+        if model in self.originals:
+            return
+
+        wrapper = TimedValidator if self.timing else InstrumentedValidator
+        # Installing again after `uninstall` keeps counting from the previous values.
+        model_stats, field_stats = self.models.get(model) or (
+            Stats(),
+            {field_name: Stats() for field_name, _, _ in model.__fields__},
+        )
+        fields = tuple(
+            (field_name, field_type, wrapper(validator, field_stats[field_name]))
+            for field_name, field_type, validator in model.__fields__
+        )
+
+        self.originals[model] = {
+            name: model.__dict__[name] for name in ("__fields__", "__init__") if name in model.__dict__
+        }
+        self.models[model] = (model_stats, field_stats)
+
+        init = model.__init__
+        if model.__config__.lazy:
+            for field, (_, _, validator) in zip(model.__lazy_fields__, fields, strict=True):
+                field.validator = validator
+        elif getattr(init, "__polymathes_codegen__", False):
+            # The generated code inlines the validation of some types, so it is generated again around the wrappers.
+            init, _ = generate_init(model, fields, assignment_init if bypasses_setattr(model) else BaseModel.__init__)
+
+        model.__fields__ = fields
+        model.__init__ = _instrument_init(init, model_stats)
+
+    def uninstall(self, model: type) -> None:
+        """
+        Stops collecting the metrics of a model, keeping the ones collected so far in the snapshots.
+
+        :param model: The model class.
+        """
+        originals = self.originals.pop(model, None)
+        if originals is None:
+            return
+
+        for name in ("__fields__", "__init__"):
+            if name in originals:
+                setattr(model, name, originals[name])
+            else:
+                delattr(model, name)
+
+        if model.__config__.lazy:
+            for field, (_, _, validator) in zip(model.__lazy_fields__, model.__fields__, strict=True):
+                field.validator = validator
+
+    def reset(self) -> None:
+        """
+        Resets every counter to zero.
+        """
+        for model_stats, field_stats in self.models.values():
+            for stats in (model_stats, *field_stats.values()):
+                stats.__init__()
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Exports the metrics collected so far, such as:
+
+        ```python
+        {
+            "shop.Order": {
+                "calls": 10,
+                "failures": 1,
+                "fields": {"price": {"calls": 10, "failures": 1, "coercions": 4, "timings_ns": {512: 9, 1024: 1}}},
+            }
+        }
+        ```
+
+        `timings_ns` is only present with `timing=True`, counting the validations taking less than each bound.
+
+        :return: The metrics of each model, keyed by its qualified name.
+        """
+        return {
+            f"{model.__module__}.{model.__qualname__}": {
+                **model_stats.snapshot(coercions=False),
+                "fields": {field_name: stats.snapshot() for field_name, stats in field_stats.items()},
+            }
+            for model, (model_stats, field_stats) in self.models.items()
+        }
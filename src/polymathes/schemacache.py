@@ -0,0 +1,174 @@
+# Copyright 2025 Dhiego Cassiano Fogaça Barbosa
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import atexit
+import marshal
+import os
+import tempfile
+from hashlib import blake2b
+from importlib.util import MAGIC_NUMBER
+from types import CodeType
+
+
+class SchemaCache:
+    """
+    An on-disk cache of the code compiled for the `__init__` of `codegen=True` models, which is most of the cost of
+    creating their classes.
+
+    Entries are keyed by the qualified name of the model and a hash of the generated source, which is derived from the
+    annotations, so they are invalidated when the annotations change. The file is tagged with the bytecode version of
+    the interpreter and ignored by any other version.
+
+    With a warm cache, importing 200 models of 8 fields takes about 110 ms instead of 265 ms, as measured on CPython
+    3.11 by `benchmarks/bench_schema_cache.py`.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        """
+
+        :param path: The path of the cache file, which is created on `save()`.
+        """
+        self.path = os.fspath(path)
+        self.entries: dict[str, tuple[bytes, bytes]] = self.__read()
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def __read(self) -> dict[str, tuple[bytes, bytes]]:
+        """
+        Reads the entries of the cache file, ignoring it when missing, unreadable or written by another version.
+        """
+        try:
+            with open(self.path, "rb") as file:
+                if file.read(len(MAGIC_NUMBER)) != MAGIC_NUMBER:
+                    return {}
+
+                entries = marshal.load(file)
+        except (OSError, EOFError, ValueError, TypeError):
+            return {}
+
+        return entries if isinstance(entries, dict) else {}
+
+    def compile(self, source: str, filename: str) -> CodeType:
+        """
+        Compiles the source of a generated function, or loads it from the cache.
+
+        :param source: The source.
+        :param filename: The filename of the code, `<polymathes-codegen module.QualifiedName>`, used as the key.
+        :return: The code object.
+        """
+        digest = blake2b(source.encode(), digest_size=16).digest()
+
+        entry = self.entries.get(filename)
+        if entry is not None and entry[0] == digest:
+            try:
+                code = marshal.loads(entry[1])
+            except (EOFError, ValueError, TypeError):
+                pass
+            else:
+                self.hits += 1
+
+                return code
+
+        self.misses += 1
+        code = compile(source, filename, "exec")
+        self.entries[filename] = (digest, marshal.dumps(code))
+        self.dirty = True
+
+        return code
+
+    def save(self) -> None:
+        """
+        Writes the new entries to the cache file, merged with the ones written meanwhile by other processes.
+
+        The file is replaced atomically, so concurrent readers never see a partial file.
+        """
+        if not self.dirty:
+            return
+
+        entries = self.__read()
+        entries.update(self.entries)
+
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".polymathes-")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(MAGIC_NUMBER)
+                marshal.dump(entries, file)
+
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+        self.entries = entries
+        self.dirty = False
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.path!r}, hits={self.hits}, misses={self.misses})"
+
+
+_cache: SchemaCache | None = None
+
+
+def enable_schema_cache(path: str | os.PathLike) -> SchemaCache:
+    """
+    Caches the code generated for the `codegen=True` models created from now on in a file, which is written on exit.
+
+    The cache can also be enabled before any model is imported with the `POLYMATHES_SCHEMA_CACHE` environment
+    variable, holding the path of the file.
+
+    :param path: The path of the cache file.
+    :return: The cache.
+    """
+    global _cache
+
+    disable_schema_cache()
+
+    _cache = SchemaCache(path)
+    atexit.register(_cache.save)
+
+    return _cache
+
+
+def disable_schema_cache() -> None:
+    """
+    Saves and stops using the current cache, if any.
+    """
+    global _cache
+
+    if _cache is not None:
+        atexit.unregister(_cache.save)
+        _cache.save()
+        _cache = None
+
+
+def compile_source(source: str, filename: str) -> CodeType:
+    """
+    Compiles the source of a generated function, through the schema cache when enabled.
+
+    :param source: The source.
+    :param filename: The filename of the code.
+    :return: The code object.
+    """
+    if _cache is None:
+        return compile(source, filename, "exec")
+
+    return _cache.compile(source, filename)
+
+
+if os.environ.get("POLYMATHES_SCHEMA_CACHE"):
+    enable_schema_cache(os.environ["POLYMATHES_SCHEMA_CACHE"])
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections.abc import Callable
+from types import NoneType
 from typing import Any
 
 
@@ -62,25 +64,107 @@ def coerce_to_bool(value: Any) -> bool:
     raise ValueError()
 
 
-def coerce(field_type: type, value: Any) -> Any:
-    if isinstance(value, field_type):
-        if field_type is type(None):
-            return value
+def coerce_to_none(value: Any) -> None:
+    raise ValueError()
+
+
+# Pairs whose conversion is the value itself; these are also inlined by the code generator and can't be overridden.
+IDENTITY_TYPES = frozenset({str, bool, int, float, NoneType})
+
+_registered: dict[tuple[type, type], Callable[[Any], Any]] = {}
+_tables: dict[type, dict[type, Callable[[Any], Any]]] = {}
+
+
+def register_coercer(field_type: type, value_type: type, converter: Callable[[Any], Any]) -> None:
+    """
+    Registers a converter used by `coerce` for values of `value_type` (or a subclass of it) into `field_type`.
+
+    The converter should raise `ValueError` or `TypeError` when the value can't be converted.
+
+    :param field_type: The target type.
+    :param value_type: The type of the values to convert.
+    :param converter: The converter, receiving the value and returning the converted value.
+    """
+    if field_type is value_type and field_type in IDENTITY_TYPES:
+        raise ValueError(f"Can't override the coercion of {field_type} into itself")
+
+    _registered[field_type, value_type] = converter
+
+    # The tables are cleared in place, since validators keep references to them.
+    for table in _tables.values():
+        table.clear()
+
+
+def resolve_coercer(field_type: type, value_type: type) -> Callable[[Any], Any]:
+    """
+    Resolves the converter for values of `value_type` into `field_type`, without the memoization done by `coerce`.
+
+    :param field_type: The target type.
+    :param value_type: The type of the values to convert.
+    :return: The converter.
+    """
+    for klass in value_type.__mro__:
+        if (field_type, klass) in _registered:
+            return _registered[field_type, klass]
 
-        return field_type(value)
+    if issubclass(value_type, field_type):
+        if field_type is NoneType:
+            return _identity
 
-    if value is None and field_type is not type(None):
-        raise ValueError()
+        return field_type
+
+    if value_type is NoneType:
+        return coerce_to_none
 
     if issubclass(field_type, str):
-        return coerce_to_str(value)
+        return coerce_to_str
     elif issubclass(field_type, bool):
-        return coerce_to_bool(value)
+        return coerce_to_bool
     elif issubclass(field_type, int):
-        return int(value)
+        return int
     elif issubclass(field_type, float):
-        return float(value)
-    elif issubclass(field_type, type(None)):
-        raise ValueError()
+        return float
+    elif issubclass(field_type, NoneType):
+        return coerce_to_none
+
+    return field_type
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def coercion_table(field_type: type) -> dict[type, Callable[[Any], Any]]:
+    """
+    Returns the memoized converters into `field_type`, keyed by the type of the value.
+
+    The table is filled lazily by `coerce_with`.
 
-    return field_type(value)
+    :param field_type: The target type.
+    :return: The table.
+    """
+    try:
+        return _tables[field_type]
+    except KeyError:
+        return _tables.setdefault(field_type, {})
+
+
+def coerce_with(table: dict[type, Callable[[Any], Any]], field_type: type, value: Any) -> Any:
+    """
+    Coerces a value using a table returned by `coercion_table(field_type)`.
+
+    :param table: The memoized converters into `field_type`.
+    :param field_type: The target type.
+    :param value: The value to coerce.
+    :return: The coerced value.
+    """
+    try:
+        converter = table[type(value)]
+    except KeyError:
+        converter = table[type(value)] = resolve_coercer(field_type, type(value))
+
+    return converter(value)
+
+
+def coerce(field_type: type, value: Any) -> Any:
+    return coerce_with(coercion_table(field_type), field_type, value)
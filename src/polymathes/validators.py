@@ -0,0 +1,759 @@
+# Copyright 2025 Dhiego Cassiano Fogaça Barbosa
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+from array import array
+from copy import copy
+from enum import Enum
+from types import NoneType, UnionType
+from typing import Annotated, Any, Literal, get_origin
+
+from polymathes.annotations import Discriminator, NumericArray
+from polymathes.errors import UnexpectedTypeError, ValidationError
+from polymathes.utils.type import coerce_with, coercion_table, is_instance_strict
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Byte order prefixes of buffer formats meaning the native byte order.
+_NATIVE_ORDER = "@=" + ("<" if sys.byteorder == "little" else ">")
+
+
+class _Invalid:
+    """
+    The type of `INVALID`.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "INVALID"
+
+
+# Returned by `Validator.try_validate` instead of raising a `ValidationError`.
+INVALID: Any = _Invalid()
+
+
+class Validator:
+    """
+    Validates a value against a type compiled ahead of time.
+
+    Validators are built once per model class by `compile_validator` and form a tree mirroring the annotation.
+    """
+
+    __slots__ = ("field_type",)
+
+    def __init__(self, field_type: Any) -> None:
+        """
+
+        :param field_type: The type this validator checks against.
+        """
+        self.field_type = field_type
+
+    def validate(self, field_name: int | str, value: Any, strict: bool = False) -> Any:
+        """
+        Parses a value to the compiled type.
+
+        :param field_name: The name of the field.
+        :param value: The value of the field.
+        :param strict: If the value should be coerced to the compiled type or not.
+        :return: The parsed value.
+        """
+        try:
+            return self.parse(field_name, value, strict)
+        except TypeError:
+            raise UnexpectedTypeError(field_name, self.field_type, value) from None
+        except ValueError:
+            raise UnexpectedTypeError(field_name, self.field_type, value) from None
+        except ValidationError as ex:
+            raise ValidationError(None, field_name, ex.value, ex) from None
+
+    def try_validate(self, field_name: int | str, value: Any, strict: bool = False) -> Any:
+        """
+        Same as `validate`, but returns `INVALID` instead of raising a `ValidationError`.
+
+        Subclasses override this to avoid building exceptions that would be thrown away, such as in unions.
+
+        :param field_name: The name of the field.
+        :param value: The value of the field.
+        :param strict: If the value should be coerced to the compiled type or not.
+        :return: The parsed value, or `INVALID`.
+        """
+        try:
+            return self.validate(field_name, value, strict)
+        except ValidationError:
+            return INVALID
+
+    def accepts_type(self, value_type: type) -> bool:
+        """
+        Checks if a value of the given type may pass strict validation, based on its type alone.
+
+        :param value_type: The type of the value.
+        :return: False if every value of this type is rejected.
+        """
+        return True
+
+    def parse(self, field_name: int | str, value: Any, strict: bool) -> Any:
+        raise NotImplementedError()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.field_type!r})"
+
+
+class ScalarValidator(Validator):
+    """
+    Validates (and coerces) a plain class, such as `int` or `str`.
+    """
+
+    __slots__ = ("converters",)
+
+    def __init__(self, field_type: Any) -> None:
+        super().__init__(field_type)
+        self.converters = coercion_table(field_type)
+
+    def validate(self, field_name: int | str, value: Any, strict: bool = False) -> Any:
+        field_type = self.field_type
+
+        try:
+            if strict and not is_instance_strict(value, field_type):
+                raise TypeError()
+
+            return coerce_with(self.converters, field_type, value)
+        except TypeError:
+            raise UnexpectedTypeError(field_name, field_type, value) from None
+        except ValueError:
+            raise UnexpectedTypeError(field_name, field_type, value) from None
+        except ValidationError as ex:
+            raise ValidationError(None, field_name, ex.value, ex) from None
+
+    def try_validate(self, field_name: int | str, value: Any, strict: bool = False) -> Any:
+        field_type = self.field_type
+
+        if strict and not is_instance_strict(value, field_type):
+            return INVALID
+
+        try:
+            return coerce_with(self.converters, field_type, value)
+        except (TypeError, ValueError, ValidationError):
+            return INVALID
+
+    def accepts_type(self, value_type: type) -> bool:
+        # Mirrors `is_instance_strict`.
+        if self.field_type in (int, float) and value_type is bool:
+            return False
+
+        try:
+            return issubclass(value_type, self.field_type)
+        except TypeError:
+            return True
+
+
+class InvalidValidator(Validator):
+    """
+    Stands in for annotations that can never be satisfied, such as `typing.Union` or string annotations.
+    """
+
+    __slots__ = ()
+
+    def validate(self, field_name: int | str, value: Any, strict: bool = False) -> Any:
+        raise UnexpectedTypeError(field_name, self.field_type, value)
+
+    def try_validate(self, field_name: int | str, value: Any, strict: bool = False) -> Any:
+        return INVALID
+
+    def accepts_type(self, value_type: type) -> bool:
+        return False
+
+
+class WrapperValidator(Validator):
+    """
+    Wraps another validator, delegating to it. Subclasses add behavior around it, such as the ones of `Metrics`.
+    """
+
+    __slots__ = ("validator",)
+
+    def __init__(self, validator: Validator) -> None:
+        """
+
+        :param validator: The wrapped validator.
+        """
+        super().__init__(validator.field_type)
+        self.validator = validator
+
+    def validate(self, field_name: int | str, value: Any, strict: bool = False) -> Any:
+        return self.validator.validate(field_name, value, strict)
+
+    def try_validate(self, field_name: int | str, value: Any, strict: bool = False) -> Any:
+        return self.validator.try_validate(field_name, value, strict)
+
+    def accepts_type(self, value_type: type) -> bool:
+        return self.validator.accepts_type(value_type)
+
+
+class EnumValidator(Validator):
+    """
+    Validates an `Enum` member, or the name of one.
+    """
+
+    __slots__ = ()
+
+    def parse(self, field_name: int | str, value: Any, strict: bool) -> Any:
+        field_type = self.field_type
+
+        if not isinstance(value, field_type):
+            if hasattr(field_type, value):
+                return field_type[value]
+
+            raise UnexpectedTypeError(field_name, field_type, value)
+
+        return value
+
+    def try_validate(self, field_name: int | str, value: Any, strict: bool = False) -> Any:
+        field_type = self.field_type
+
+        if isinstance(value, field_type):
+            return value
+
+        try:
+            if hasattr(field_type, value):
+                return field_type[value]
+        except TypeError:
+            pass
+
+        return INVALID
+
+    def accepts_type(self, value_type: type) -> bool:
+        # Anything else makes `hasattr` raise a `TypeError`.
+        return issubclass(value_type, (self.field_type, str))
+
+
+class ModelValidator(Validator):
+    """
+    Validates a nested `BaseModel`.
+
+    Existing instances of the model are accepted as-is (or copied), according to the `passthrough` options of its
+    config.
+    """
+
+    __slots__ = ("passthrough", "copy", "subclasses")
+
+    def __init__(self, field_type: Any) -> None:
+        super().__init__(field_type)
+
+        config = field_type.__config__
+        self.passthrough = config.passthrough
+        self.copy = config.passthrough_copy
+        self.subclasses = config.passthrough_subclasses
+
+    def parse(self, field_name: int | str, value: Any, strict: bool) -> Any:
+        field_type = self.field_type
+
+        if self.passthrough and (type(value) is field_type or (self.subclasses and isinstance(value, field_type))):
+            return copy(value) if self.copy else value
+
+        return field_type(**value)
+
+    def accepts_type(self, value_type: type) -> bool:
+        # Unpacking with `**` requires a mapping.
+        return hasattr(value_type, "keys")
+
+
+class LiteralValidator(Validator):
+    """
+    Validates a `Literal[...]`. Values must be one of the literals, with the same type; enum members also accept their
+    name.
+    """
+
+    __slots__ = ("values", "types")
+
+    def __init__(self, field_type: Any) -> None:
+        super().__init__(field_type)
+        self.values: dict[tuple[type, Any], Any] = {}
+
+        for literal in field_type.__args__:
+            self.values.setdefault((type(literal), literal), literal)
+
+            if isinstance(literal, Enum):
+                self.values.setdefault((str, literal.name), literal)
+
+        self.types = frozenset(value_type for value_type, _ in self.values)
+
+    def parse(self, field_name: int | str, value: Any, strict: bool) -> Any:
+        result = self.try_validate(field_name, value, strict)
+        if result is INVALID:
+            raise UnexpectedTypeError(field_name, self.field_type, value)
+
+        return result
+
+    def try_validate(self, field_name: int | str, value: Any, strict: bool = False) -> Any:
+        try:
+            return self.values.get((type(value), value), INVALID)
+        except TypeError:
+            return INVALID
+
+    def accepts_type(self, value_type: type) -> bool:
+        return value_type in self.types
+
+
+class DiscriminatedUnionValidator(Validator):
+    """
+    Validates a union of models marked with a `Discriminator`, picking the model from the value of the tag field.
+    """
+
+    __slots__ = ("tag", "models")
+
+    def __init__(self, field_type: Any, tag: str, models: dict[tuple[type, Any], Validator]) -> None:
+        super().__init__(field_type)
+        self.tag = tag
+        self.models = models
+
+    def parse(self, field_name: int | str, value: Any, strict: bool) -> Any:
+        try:
+            tag = value[self.tag]
+        except (KeyError, IndexError, AttributeError, TypeError):
+            raise UnexpectedTypeError(field_name, self.field_type, value) from None
+
+        try:
+            model = self.models[type(tag), tag]
+        except (KeyError, TypeError):
+            raise UnexpectedTypeError(field_name, self.field_type, value) from None
+
+        return model.parse(field_name, value, strict)
+
+    def accepts_type(self, value_type: type) -> bool:
+        return hasattr(value_type, "keys")
+
+
+class UnionValidator(Validator):
+    """
+    Validates a `X | Y` union, returning the first option that strictly matches.
+
+    The options that may accept each type of value are memoized, so most values are only checked against one option,
+    and failed options report `INVALID` instead of raising.
+    """
+
+    __slots__ = ("options", "dispatch")
+
+    def __init__(self, field_type: UnionType, options: tuple[Validator, ...]) -> None:
+        super().__init__(field_type)
+        self.options = options
+        self.dispatch: dict[type, tuple[Validator, ...]] = {}
+
+    def candidates(self, value_type: type) -> tuple[Validator, ...]:
+        try:
+            return self.dispatch[value_type]
+        except KeyError:
+            candidates = tuple(option for option in self.options if option.accepts_type(value_type))
+            self.dispatch[value_type] = candidates
+
+            return candidates
+
+    def parse(self, field_name: int | str, value: Any, strict: bool) -> Any:
+        result = self.try_validate(field_name, value, strict)
+        if result is INVALID:
+            raise UnexpectedTypeError(field_name, self.field_type, value)
+
+        return result
+
+    def try_validate(self, field_name: int | str, value: Any, strict: bool = False) -> Any:
+        for option in self.candidates(type(value)):
+            result = option.try_validate(field_name, value, True)
+            if result is not INVALID:
+                return result
+
+        return INVALID
+
+    def accepts_type(self, value_type: type) -> bool:
+        return bool(self.candidates(value_type))
+
+
+class ListValidator(Validator):
+    """
+    Validates a `list[X]`.
+    """
+
+    __slots__ = ("item",)
+
+    def __init__(self, field_type: Any, item: Validator) -> None:
+        super().__init__(field_type)
+        self.item = item
+
+    def parse(self, field_name: int | str, value: Any, strict: bool) -> list[Any]:
+        if not isinstance(value, list):
+            raise UnexpectedTypeError(field_name, self.field_type, value)
+
+        validate = self.item.validate
+
+        return [validate(index, item) for index, item in enumerate(value)]
+
+    def try_validate(self, field_name: int | str, value: Any, strict: bool = False) -> Any:
+        if not isinstance(value, list):
+            return INVALID
+
+        try_validate = self.item.try_validate
+        result = []
+        for index, item in enumerate(value):
+            item = try_validate(index, item)
+            if item is INVALID:
+                return INVALID
+
+            result.append(item)
+
+        return result
+
+    def accepts_type(self, value_type: type) -> bool:
+        return issubclass(value_type, list)
+
+
+class FrozenListValidator(Validator):
+    """
+    Validates a `list[X]` of a frozen model, storing it as a tuple so the model can be hashed.
+
+    Tuples are accepted too, such as the value of the same field of another frozen model.
+    """
+
+    __slots__ = ("item",)
+
+    def __init__(self, field_type: Any, item: Validator) -> None:
+        super().__init__(field_type)
+        self.item = item
+
+    def parse(self, field_name: int | str, value: Any, strict: bool) -> tuple[Any, ...]:
+        if not isinstance(value, list | tuple):
+            raise UnexpectedTypeError(field_name, self.field_type, value)
+
+        validate = self.item.validate
+
+        return tuple([validate(index, item) for index, item in enumerate(value)])
+
+    def try_validate(self, field_name: int | str, value: Any, strict: bool = False) -> Any:
+        if not isinstance(value, list | tuple):
+            return INVALID
+
+        try_validate = self.item.try_validate
+        result = []
+        for index, item in enumerate(value):
+            item = try_validate(index, item)
+            if item is INVALID:
+                return INVALID
+
+            result.append(item)
+
+        return tuple(result)
+
+    def accepts_type(self, value_type: type) -> bool:
+        return issubclass(value_type, list | tuple)
+
+
+class ArrayValidator(Validator):
+    """
+    Validates a `NumericArray`, converting the whole sequence at once.
+    """
+
+    __slots__ = ("item",)
+
+    def __init__(self, field_type: type[NumericArray]) -> None:
+        super().__init__(field_type)
+        self.item = ScalarValidator(field_type.item_type)
+
+    def parse(self, field_name: int | str, value: Any, strict: bool) -> Any:
+        field_type = self.field_type
+
+        if numpy is not None and isinstance(value, numpy.ndarray):
+            if value.dtype == field_type.dtype and value.ndim == 1:
+                return value
+        elif numpy is None and isinstance(value, array) and value.typecode == field_type.typecode:
+            return value
+
+        if isinstance(value, list | tuple):
+            result = self.__convert(value, strict)
+        else:
+            try:
+                view = memoryview(value)
+            except TypeError:
+                raise UnexpectedTypeError(field_name, field_type, value) from None
+
+            if view.ndim != 1:
+                raise UnexpectedTypeError(field_name, field_type, value)
+
+            item_format = view.format.lstrip(_NATIVE_ORDER)
+            if (item_format in field_type.formats and view.itemsize == 8) or item_format in ("B", "b", "c"):
+                if not view.c_contiguous or view.nbytes % 8:
+                    raise UnexpectedTypeError(field_name, field_type, value)
+
+                if numpy is not None:
+                    return numpy.frombuffer(view, field_type.dtype)
+
+                result = array(field_type.typecode)
+                result.frombytes(view)
+
+                return result
+
+            result = self.__convert(view.tolist(), strict)
+
+        if numpy is not None:
+            return numpy.frombuffer(result, field_type.dtype)
+
+        return result
+
+    def __convert(self, value: list | tuple, strict: bool) -> array:
+        """
+        Converts a sequence into an `array.array`, coercing the items one by one only when they aren't all numbers.
+        """
+        typecode = self.field_type.typecode
+
+        if not strict:
+            try:
+                return array(typecode, value)
+            except (TypeError, OverflowError):
+                pass
+
+        validate = self.item.validate
+        result = array(typecode)
+        for index, item in enumerate(value):
+            item = validate(index, item, strict)
+
+            try:
+                result.append(item)
+            except OverflowError:
+                raise UnexpectedTypeError(index, self.field_type.item_type, item) from None
+
+        return result
+
+
+class TupleValidator(Validator):
+    """
+    Validates a `tuple[X, Y, ...]`, either with a fixed length or variadic (`tuple[X, ...]`).
+    """
+
+    __slots__ = ("items", "variadic")
+
+    def __init__(self, field_type: Any, items: tuple[Validator, ...], variadic: bool) -> None:
+        super().__init__(field_type)
+        self.items = items
+        self.variadic = variadic
+
+    def parse(self, field_name: int | str, value: Any, strict: bool) -> tuple[Any, ...]:
+        if not isinstance(value, tuple):
+            raise UnexpectedTypeError(field_name, self.field_type, value)
+
+        if self.variadic:
+            validate = self.items[0].validate
+
+            return tuple(validate(index, item) for index, item in enumerate(value))
+
+        if len(value) != len(self.items):
+            raise UnexpectedTypeError(field_name, self.field_type, value)
+
+        items = zip(self.items, value, strict=True)
+
+        return tuple(validator.validate(index, item) for index, (validator, item) in enumerate(items))
+
+    def try_validate(self, field_name: int | str, value: Any, strict: bool = False) -> Any:
+        if not isinstance(value, tuple):
+            return INVALID
+
+        if self.variadic:
+            validators = (self.items[0],) * len(value)
+        elif len(value) != len(self.items):
+            return INVALID
+        else:
+            validators = self.items
+
+        result = []
+        for index, (validator, item) in enumerate(zip(validators, value, strict=True)):
+            item = validator.try_validate(index, item)
+            if item is INVALID:
+                return INVALID
+
+            result.append(item)
+
+        return tuple(result)
+
+    def accepts_type(self, value_type: type) -> bool:
+        return issubclass(value_type, tuple)
+
+
+class DictValidator(Validator):
+    """
+    Validates a `dict[K, V]`.
+    """
+
+    __slots__ = ("key", "value")
+
+    def __init__(self, field_type: Any, key: Validator, value: Validator) -> None:
+        super().__init__(field_type)
+        self.key = key
+        self.value = value
+
+    def parse(self, field_name: int | str, value: Any, strict: bool) -> dict[Any, Any]:
+        if not isinstance(value, dict):
+            raise UnexpectedTypeError(field_name, self.field_type, value)
+
+        validate_key = self.key.validate
+        validate_value = self.value.validate
+
+        return {validate_key(key, key): validate_value(item, item) for key, item in value.items()}
+
+    def try_validate(self, field_name: int | str, value: Any, strict: bool = False) -> Any:
+        if not isinstance(value, dict):
+            return INVALID
+
+        try_validate_key = self.key.try_validate
+        try_validate_value = self.value.try_validate
+        result = {}
+        for key, item in value.items():
+            key = try_validate_key(key, key)
+            if key is INVALID:
+                return INVALID
+
+            item = try_validate_value(item, item)
+            if item is INVALID:
+                return INVALID
+
+            try:
+                result[key] = item
+            except TypeError:
+                return INVALID
+
+        return result
+
+    def accepts_type(self, value_type: type) -> bool:
+        return issubclass(value_type, dict)
+
+
+def freeze_validator(validator: Validator) -> Validator:
+    """
+    Rebuilds a tree of validators so that the lists it accepts, at any depth, are stored as tuples.
+
+    :param validator: The root validator.
+    :return: The new root validator, or the same one if it has no lists.
+    :raise TypeError: If the tree accepts values that can't be frozen: dicts, arrays, unhashable classes and models
+        that aren't frozen.
+    """
+    if isinstance(validator, ListValidator):
+        return FrozenListValidator(validator.field_type, freeze_validator(validator.item))
+
+    if isinstance(validator, TupleValidator):
+        return TupleValidator(
+            validator.field_type, tuple(freeze_validator(item) for item in validator.items), validator.variadic
+        )
+
+    if isinstance(validator, UnionValidator):
+        return UnionValidator(validator.field_type, tuple(freeze_validator(option) for option in validator.options))
+
+    if isinstance(validator, DictValidator | ArrayValidator):
+        raise TypeError(f"{validator.field_type} is mutable")
+
+    if isinstance(validator, ScalarValidator) and validator.field_type.__hash__ is None:
+        # Bare classes such as `list`, `set` or `dict`.
+        raise TypeError(f"{validator.field_type.__name__} isn't hashable")
+
+    if isinstance(validator, ModelValidator) and not validator.field_type.__config__.frozen:
+        raise TypeError(f"{validator.field_type.__name__} isn't frozen")
+
+    if isinstance(validator, DiscriminatedUnionValidator):
+        for option in validator.models.values():
+            freeze_validator(option)
+
+    return validator
+
+
+def compile_discriminated(field_type: Any, discriminator: Discriminator) -> Validator:
+    """
+    Compiles a union of models marked with a `Discriminator`.
+
+    :param field_type: The union of models.
+    :param discriminator: The discriminator.
+    :return: The validator.
+    """
+    from polymathes.models import BaseModel
+
+    members = field_type.__args__ if isinstance(field_type, UnionType) else (field_type,)
+    models: dict[tuple[type, Any], Validator] = {}
+
+    for model in members:
+        if not isinstance(model, type) or not issubclass(model, BaseModel):
+            raise TypeError(f"Discriminated unions only support models, got {model}")
+
+        tag = next((v for name, _, v in model.__fields__ if name == discriminator.field_name), None)
+        if not isinstance(tag, LiteralValidator):
+            raise TypeError(f"{model.__qualname__}.{discriminator.field_name} must be annotated with a Literal")
+
+        validator = ModelValidator(model)
+        for key in tag.values:
+            models.setdefault(key, validator)
+
+    return DiscriminatedUnionValidator(field_type, discriminator.field_name, models)
+
+
+def compile_validator(field_type: Any) -> Validator:
+    """
+    Compiles a type annotation into a tree of validators.
+
+    :param field_type: The type annotation.
+    :return: The root validator.
+    """
+    from polymathes.models import BaseModel
+
+    if field_type is None:
+        field_type = NoneType
+
+    origin = get_origin(field_type)
+
+    if origin is Annotated:
+        for metadata in field_type.__metadata__:
+            if isinstance(metadata, Discriminator):
+                return compile_discriminated(field_type.__origin__, metadata)
+
+        return compile_validator(field_type.__origin__)
+
+    if origin is Literal:
+        return LiteralValidator(field_type)
+
+    if origin is list:
+        return ListValidator(field_type, compile_validator(field_type.__args__[0]))
+
+    if origin is tuple:
+        values_types = field_type.__args__
+        if len(values_types) == 2 and values_types[1] is ...:
+            return TupleValidator(field_type, (compile_validator(values_types[0]),), True)
+
+        return TupleValidator(field_type, tuple(compile_validator(t) for t in values_types), False)
+
+    if origin is dict:
+        return DictValidator(
+            field_type,
+            compile_validator(field_type.__args__[0]),
+            compile_validator(field_type.__args__[1]),
+        )
+
+    if isinstance(field_type, UnionType):
+        return UnionValidator(field_type, tuple(compile_validator(t) for t in field_type.__args__))
+
+    if isinstance(field_type, type) and issubclass(field_type, NumericArray):
+        return ArrayValidator(field_type)
+
+    try:
+        if issubclass(field_type, Enum):
+            return EnumValidator(field_type)
+
+        if issubclass(field_type, BaseModel):
+            return ModelValidator(field_type)
+    except TypeError:
+        return InvalidValidator(field_type)
+
+    return ScalarValidator(field_type)
@@ -0,0 +1,60 @@
+import asyncio
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from polymathes.errors import LineError, ValidationError
+from polymathes.models import BaseModel
+
+
+class SampleModel(BaseModel):
+    value: int
+
+
+async def source(records: list) -> AsyncIterator:
+    for record in records:
+        yield record
+
+
+async def collect(**kwargs) -> list[int]:
+    return [model.value async for model in SampleModel.aiter_validate(**kwargs)]
+
+
+def test_mappings() -> None:
+    records = [{"value": index} for index in range(10)]
+
+    assert asyncio.run(collect(source=source(records), batch_size=3)) == list(range(10))
+
+
+def test_stream_reader() -> None:
+    async def run() -> list[int]:
+        reader = asyncio.StreamReader()
+        reader.feed_data(b'{"value": 1}\n\n{"value": "2"}\n')
+        reader.feed_eof()
+
+        return await collect(source=reader)
+
+    assert asyncio.run(run()) == [1, 2]
+
+
+def test_executor() -> None:
+    records = [{"value": str(index)} for index in range(10)]
+
+    with ThreadPoolExecutor(2) as executor:
+        assert asyncio.run(collect(source=source(records), batch_size=3, executor=executor)) == list(range(10))
+
+
+@pytest.mark.parametrize("executor", [None, ThreadPoolExecutor(1)])
+def test_errors(executor: ThreadPoolExecutor | None) -> None:
+    errors = []
+    records = [{"value": 1}, {"value": "a"}, '{"value": 3, "name": "é"}\n', b"{\n"]
+
+    assert asyncio.run(collect(source=source(records), errors=errors, batch_size=2, executor=executor)) == [1, 3]
+    assert [index for index, _ in errors] == [1, 3]
+    assert isinstance(errors[1][1], LineError)
+    # Offsets are counted in bytes, also for `str` records.
+    assert errors[1][1].offset == 27
+
+    with pytest.raises(ValidationError):
+        asyncio.run(collect(source=source(records), executor=executor))
@@ -0,0 +1,85 @@
+from array import array
+
+import pytest
+
+from polymathes import Float64Array, Int64Array
+from polymathes.errors import ValidationError
+from polymathes.models import BaseModel
+from polymathes.validators import numpy
+
+
+class SampleModel(BaseModel):
+    samples: Float64Array
+    counts: Int64Array
+
+
+def test_array_list() -> None:
+    model = SampleModel(samples=[1, 2.5, True], counts=(1, 2))
+
+    assert list(model.samples) == [1.0, 2.5, 1.0]
+    assert list(model.counts) == [1, 2]
+
+
+def test_array_coerce() -> None:
+    model = SampleModel(samples=["1.5", 2], counts=[1.0, "2"])
+
+    assert list(model.samples) == [1.5, 2.0]
+    assert list(model.counts) == [1, 2]
+
+
+def test_array_invalid_item() -> None:
+    with pytest.raises(ValidationError) as ex:
+        SampleModel(samples=[1.0, 2.0, "not a float"], counts=[])
+
+    assert ex.value.get_full_field_name() == "samples.2"
+
+
+def test_array_overflow() -> None:
+    with pytest.raises(ValidationError) as ex:
+        SampleModel(samples=[], counts=[1, 1 << 64])
+
+    assert ex.value.get_full_field_name() == "counts.1"
+
+
+def test_array_invalid() -> None:
+    with pytest.raises(ValidationError):
+        SampleModel(samples=1.0, counts=[])
+
+    with pytest.raises(ValidationError):
+        SampleModel(samples=memoryview(b"\x00" * 9), counts=[])
+
+
+def test_array_buffer() -> None:
+    model = SampleModel(samples=array("d", [1.5, 2.5]).tobytes(), counts=array("i", [1, 2]))
+
+    assert list(model.samples) == [1.5, 2.5]
+    assert list(model.counts) == [1, 2]
+
+
+def test_array_dump_json() -> None:
+    model = SampleModel(samples=[1.5], counts=[2])
+
+    assert model.dump_json() == b'{"samples":[1.5],"counts":[2]}'
+
+
+@pytest.mark.skipif(numpy is not None, reason="Stored in NumPy arrays")
+def test_array_storage() -> None:
+    samples = array("d", [1.5])
+    model = SampleModel(samples=samples, counts=[1])
+
+    assert model.samples is samples
+    assert isinstance(model.counts, array)
+    assert model.counts.typecode == "q"
+
+
+def test_array_numpy() -> None:
+    np = pytest.importorskip("numpy")
+
+    samples = np.array([1.5, 2.5])
+    buffer = bytearray(array("q", [1, 2]).tobytes())
+    model = SampleModel(samples=samples, counts=buffer)
+
+    assert model.samples is samples
+    assert model.counts.dtype == np.int64
+    assert np.shares_memory(model.counts, np.frombuffer(buffer, np.int64))
+    assert list(SampleModel(samples=np.array([1, 2], dtype=np.int32), counts=[]).samples) == [1.0, 2.0]
@@ -0,0 +1,134 @@
+import pytest
+
+from polymathes.errors import ValidationError
+from polymathes.models import BaseModel
+
+
+class SubModel(BaseModel):
+    value: int
+
+
+class SampleModel(BaseModel, validate_assignment=True):
+    value: int
+    items: list[int]
+    sub: SubModel
+    default: str | None = None
+
+
+class SampleCodegenModel(SampleModel, codegen=True):
+    pass
+
+
+class SampleSlotsModel(BaseModel, slots=True, validate_assignment=True):
+    value: int
+    default: str | None = None
+
+
+class SampleLazyModel(BaseModel, lazy=True):
+    value: int
+    items: list[int]
+
+
+class SampleUncheckedModel(SampleModel, validate_assignment=False):
+    pass
+
+
+def build(model: type[SampleModel] = SampleModel) -> SampleModel:
+    return model(value="1", items=[1, "2"], sub={"value": 3})
+
+
+@pytest.mark.parametrize("model", [SampleModel, SampleCodegenModel, SampleSlotsModel])
+def test_validate_assignment(model: type[SampleModel]) -> None:
+    instance = model(value="1", items=[], sub={"value": 1})
+
+    instance.value = "2"
+    assert instance.value == 2
+
+    with pytest.raises(ValidationError):
+        instance.value = "a"
+
+    assert instance.value == 2
+
+
+class FailingValidator:
+    def validate(self, field_name: str, value: object) -> None:
+        raise AssertionError("Validated on assignment")
+
+
+@pytest.mark.parametrize("model", [SampleModel, SampleCodegenModel])
+def test_validate_assignment_init(model: type[SampleModel], monkeypatch: pytest.MonkeyPatch) -> None:
+    # `__init__` stores the values it validated without going through `__setattr__`.
+    monkeypatch.setattr(model, "__validators__", {"items": FailingValidator()})
+
+    build(model)
+
+    with pytest.raises(AssertionError):
+        build(model).items = []
+
+
+@pytest.mark.parametrize("model", [SampleModel, SampleCodegenModel])
+def test_validate_assignment_json(model: type[SampleModel], monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(model, "__validators__", {"items": FailingValidator()})
+
+    assert model.validate_json('{"value": "1", "items": [1, "2"], "sub": {"value": 3}}').items == [1, 2]
+
+
+def test_validate_assignment_other_attributes() -> None:
+    model = build()
+    model.other = "a"
+
+    assert model.other == "a"
+
+
+def test_validate_assignment_disabled() -> None:
+    model = build(SampleUncheckedModel)
+    model.value = "a"
+
+    assert model.value == "a"
+
+
+def test_update() -> None:
+    model = build()
+    sub = model.sub
+
+    model.update(value="5", default="a")
+
+    assert (model.value, model.default) == (5, "a")
+    assert model.sub is sub
+
+    with pytest.raises(ValidationError):
+        model.update(items=[1], value="a")
+
+    assert model.items == [1, 2]
+
+    with pytest.raises(TypeError):
+        model.update(other=1)
+
+
+def test_copy() -> None:
+    model = build()
+    copied = model.copy(update={"value": "7"})
+
+    assert copied.value == 7
+    assert model.value == 1
+    assert copied.items is model.items
+    assert copied.sub is model.sub
+    assert model.copy().dump() == model.dump()
+
+
+def test_copy_slots() -> None:
+    model = SampleSlotsModel(value=1)
+    copied = model.copy(update={"default": "a"})
+
+    assert (copied.value, copied.default) == (1, "a")
+    assert model.default is None
+
+
+def test_copy_lazy() -> None:
+    model = SampleLazyModel(value="1", items=["2"])
+    copied = model.copy(update={"value": 3})
+
+    assert copied.value == 3
+    assert copied.items == [2]
+    assert model.value == 1
+    assert model.items == [2]
@@ -0,0 +1,72 @@
+from types import MappingProxyType
+
+import pytest
+
+from polymathes.errors import ValidationError
+from polymathes.models import BaseModel
+
+
+class SampleModel(BaseModel):
+    value: int
+    default: str | None = None
+
+
+class SampleCodegenModel(BaseModel, codegen=True):
+    value: int
+
+
+def test_validate_many() -> None:
+    models = SampleModel.validate_many([{"value": 1}, {"value": "2"}, MappingProxyType({"value": 3.0})])
+
+    assert [model.value for model in models] == [1, 2, 3]
+    assert models[0].default is None
+
+
+def test_validate_many_codegen() -> None:
+    assert [model.value for model in SampleCodegenModel.validate_many([{"value": "1"}])] == [1]
+
+
+def test_validate_many_raise() -> None:
+    with pytest.raises(ValidationError):
+        SampleModel.validate_many([{"value": 1}, {"value": "a"}])
+
+    with pytest.raises(ValidationError):
+        SampleModel.validate_many([{}])
+
+
+def test_validate_many_stream() -> None:
+    models = SampleModel.validate_many(iter([{"value": 1}, {"value": "a"}]), stream=True)
+
+    assert next(models).value == 1
+
+    with pytest.raises(ValidationError):
+        next(models)
+
+
+def test_validate_many_collect() -> None:
+    errors = []
+    models = SampleModel.validate_many([{"value": "a"}, {"value": 1}, {}], errors=errors)
+
+    assert [model.value for model in models] == [1]
+    assert [index for index, _ in errors] == [0, 2]
+
+
+def test_validate_many_workers() -> None:
+    data = [{"value": str(index)} for index in range(100)]
+
+    assert [model.value for model in SampleModel.validate_many(data, workers=2, chunk_size=7)] == list(range(100))
+
+
+def test_validate_many_workers_collect() -> None:
+    errors = []
+    data = [{"value": "a" if index % 10 == 0 else index} for index in range(50)]
+    models = SampleModel.validate_many(data, workers=2, chunk_size=7, errors=errors)
+
+    assert len(models) == 45
+    assert [index for index, _ in errors] == [0, 10, 20, 30, 40]
+    assert errors[0][1].get_full_field_name() == "value"
+
+
+def test_validate_many_workers_raise() -> None:
+    with pytest.raises(ValidationError):
+        SampleModel.validate_many([{"value": 1}, {"value": "a"}], workers=2)
@@ -0,0 +1,69 @@
+import inspect
+
+import pytest
+
+from polymathes.errors import ValidationError
+from polymathes.models import BaseModel
+
+
+class SampleSubModel(BaseModel):
+    a: int
+
+
+class SampleModel(BaseModel, codegen=True):
+    value: int
+    items: list[int]
+    pair: tuple[int, str]
+    mapping: dict[str, float]
+    option: int | str
+    sub: SampleSubModel
+
+
+class SampleInheritedModel(SampleModel):
+    extra: str
+
+
+class SampleCustomInitModel(SampleModel):
+    def __init__(self, /, **kwargs) -> None:
+        super().__init__(**kwargs)
+
+
+def build(model: type[SampleModel], **kwargs) -> SampleModel:
+    return model(value="1", items=[1, "2"], pair=(1, 2), mapping={"a": 1}, option="x", sub={"a": 1}, **kwargs)
+
+
+def test_generated() -> None:
+    assert "def __init__" in inspect.getsource(SampleModel.__init__)
+
+
+def test_values() -> None:
+    model = build(SampleModel)
+
+    assert model.value == 1
+    assert model.items == [1, 2]
+    assert model.pair == (1, "2")
+    assert model.mapping == {"a": 1.0}
+    assert model.option == "x"
+    assert isinstance(model.sub, SampleSubModel)
+
+
+def test_errors() -> None:
+    with pytest.raises(ValidationError) as ex:
+        SampleModel(value=1, items=[1, "a"], pair=(1, 2), mapping={}, option="x", sub={"a": 1})
+
+    assert ex.value.get_full_field_name() == "items.1"
+
+    with pytest.raises(ValidationError):
+        SampleModel(value=1)
+
+
+def test_inherited() -> None:
+    assert build(SampleInheritedModel, extra=1).extra == "1"
+    assert build(SampleCustomInitModel).value == 1
+
+
+def test_dump(capsys: pytest.CaptureFixture[str]) -> None:
+    class SampleDumpModel(BaseModel, codegen=True, codegen_dump=True):
+        value: int
+
+    assert "def __init__" in capsys.readouterr().err
@@ -0,0 +1,55 @@
+import pytest
+
+from polymathes.errors import ValidationError
+from polymathes.models import BaseModel
+from polymathes.utils.type import coerce, register_coercer
+
+
+class SampleScalar:
+    def __init__(self, raw: str) -> None:
+        self.raw = raw
+
+
+class SampleStr(str):
+    pass
+
+
+class SampleModel(BaseModel):
+    value: SampleScalar
+
+
+def parse_sample(value: str) -> SampleScalar:
+    if not value.startswith("#"):
+        raise ValueError()
+
+    return SampleScalar(value[1:])
+
+
+register_coercer(SampleScalar, str, parse_sample)
+
+
+def test_memoized() -> None:
+    assert coerce(int, "1") == 1
+    assert coerce(int, "2") == 2
+    assert coerce(str, True) == "true"
+
+
+def test_registered() -> None:
+    assert SampleModel(value="#a").value.raw == "a"
+
+
+def test_registered_subclass() -> None:
+    assert SampleModel(value=SampleStr("#b")).value.raw == "b"
+
+
+def test_registered_wrong() -> None:
+    with pytest.raises(ValidationError):
+        SampleModel(value="a")
+
+    with pytest.raises(ValidationError):
+        SampleModel(value=None)
+
+
+def test_register_identity() -> None:
+    with pytest.raises(ValueError):
+        register_coercer(int, int, int)
@@ -0,0 +1,144 @@
+import json
+from typing import Annotated, Literal
+
+import pytest
+
+from polymathes import Discriminator
+from polymathes.errors import AggregateError, RequiredFieldError, ValidationError
+from polymathes.models import BaseModel
+
+
+class SubModel(BaseModel):
+    value: int
+    name: str
+
+
+class CatModel(BaseModel):
+    kind: Literal["cat"]
+    lives: int
+
+
+class SampleModel(BaseModel, collect_errors=True):
+    value: int
+    items: list[int]
+    pair: tuple[int, float]
+    mapping: dict[str, SubModel]
+    sub: SubModel
+    pet: Annotated[CatModel, Discriminator("kind")]
+    note: str | None = None
+
+
+class SampleCodegenModel(SampleModel, codegen=True):
+    pass
+
+
+class SampleLimitModel(BaseModel, collect_errors=True, max_errors=3):
+    items: list[int]
+
+
+def paths(ex: AggregateError) -> list[str]:
+    return [error.get_full_field_name() for error in ex.errors]
+
+
+@pytest.mark.parametrize("model", [SampleModel, SampleCodegenModel])
+def test_collect_errors(model: type[SampleModel]) -> None:
+    with pytest.raises(AggregateError) as ex:
+        model(
+            value="a",
+            items=[1, "b", 2, "c"],
+            pair=(1, "d"),
+            mapping={"x": {"value": 1}},
+            sub={"value": "e", "name": 1},
+            pet={"kind": "cat", "lives": "f"},
+        )
+
+    assert paths(ex.value) == ["value", "items.1", "items.3", "pair.1", "mapping.x.name", "sub.value", "pet.lives"]
+    assert isinstance(ex.value.errors[4].base_ex.base_ex, RequiredFieldError)
+    assert ex.value.get_full_field_name() == "value"
+    assert not ex.value.truncated
+    assert str(ex.value).startswith("7 validation errors\n  value: ")
+
+
+@pytest.mark.parametrize("model", [SampleModel, SampleCodegenModel])
+def test_collect_errors_valid(model: type[SampleModel]) -> None:
+    instance = model(
+        value=1,
+        items=[1],
+        pair=(1, 2),
+        mapping={},
+        sub={"value": 1, "name": "a"},
+        pet={"kind": "cat", "lives": 9},
+    )
+
+    assert instance.note is None
+
+
+def test_collect_errors_required() -> None:
+    with pytest.raises(AggregateError) as ex:
+        SampleModel(value=1)
+
+    assert paths(ex.value) == ["items", "pair", "mapping", "sub", "pet"]
+
+
+def test_collect_errors_max() -> None:
+    with pytest.raises(AggregateError) as ex:
+        SampleLimitModel(items=["a"] * 1_000_000)
+
+    assert paths(ex.value) == ["items.0", "items.1", "items.2"]
+    assert ex.value.truncated
+
+
+def test_collect_errors_max_reached() -> None:
+    with pytest.raises(AggregateError) as ex:
+        SampleLimitModel(items=[1, "a", "b", "c"])
+
+    assert not ex.value.truncated
+    assert str(ex.value).startswith("3 validation errors\n")
+
+
+@pytest.mark.parametrize("model", [SampleModel, SampleCodegenModel, SampleLimitModel])
+def test_collect_errors_validate_json(model: type[BaseModel]) -> None:
+    document = '{"value": "a", "items": ["b", "c"], "pair": [1, "2"], "sub": {"value": "d"}}'
+
+    with pytest.raises(AggregateError) as ex:
+        model.validate_json(document)
+
+    with pytest.raises(AggregateError) as expected:
+        model(**json.loads(document))
+
+    # The same errors, except that JSON arrays are accepted for tuple fields.
+    assert paths(ex.value) == [path for path in paths(expected.value) if not path.startswith("pair")]
+
+
+class SampleTupleModel(BaseModel, collect_errors=True):
+    pair: tuple[int, int]
+    sub: SubModel
+
+
+def test_collect_errors_validate_json_tuples() -> None:
+    assert SampleTupleModel.validate_json('{"pair": [1, "2"], "sub": {"value": 1, "name": "a"}}').pair == (1, 2)
+
+    with pytest.raises(AggregateError) as ex:
+        SampleTupleModel.validate_json('{"pair": [1, "x"], "sub": {"value": "y"}}')
+
+    assert paths(ex.value) == ["pair.1", "sub.value", "sub.name"]
+
+    with pytest.raises(ValidationError) as ex:
+        SampleTupleModel.validate_json('{"pair": [1, "x"], "sub": ')
+
+    assert not isinstance(ex.value, AggregateError)
+
+
+def test_collect_errors_validate_many() -> None:
+    errors = []
+    SampleLimitModel.validate_many([{"items": ["a", "b"]}], errors=errors)
+
+    assert isinstance(errors[0][1], AggregateError)
+    assert paths(errors[0][1]) == ["items.0", "items.1"]
+
+
+def test_fail_fast() -> None:
+    with pytest.raises(ValidationError) as ex:
+        SubModel(value="a", name=1)
+
+    assert not isinstance(ex.value, AggregateError)
@@ -0,0 +1,95 @@
+from array import array
+
+import pytest
+
+from polymathes.errors import RequiredFieldError, ValidationError
+from polymathes.models import BaseModel
+
+
+class SampleModel(BaseModel):
+    price: float
+    qty: int
+    name: str
+    note: str | None = None
+
+
+class SampleSlotsModel(BaseModel, slots=True):
+    value: int
+    note: str | None = None
+
+
+class SampleFrozenModel(BaseModel, frozen=True):
+    value: int
+    names: list[str]
+
+
+def test_validate_columns() -> None:
+    frame = SampleModel.validate_columns({"price": [1.5, 2], "qty": [1, "2"], "name": ["a", 3]})
+
+    assert len(frame) == 2
+    assert frame.column("price") == array("d", [1.5, 2.0])
+    assert frame.column("qty") == array("q", [1, 2])
+    assert frame.column("name") == ["a", "3"]
+    assert frame.column("note") == [None, None]
+
+
+def test_validate_columns_rows() -> None:
+    frame = SampleModel.validate_columns({"price": [1.5, 2.5], "qty": [1, 2], "name": ["a", "b"]})
+
+    model = frame[-1]
+    assert isinstance(model, SampleModel)
+    assert (model.price, model.qty, model.name, model.note) == (2.5, 2, "b", None)
+    assert [model.qty for model in frame] == [1, 2]
+
+    with pytest.raises(IndexError):
+        frame[2]
+
+
+def test_validate_columns_big_int() -> None:
+    frame = SampleModel.validate_columns({"price": [], "qty": [], "name": []})
+    assert len(frame) == 0
+
+    frame = SampleModel.validate_columns({"price": [1.0], "qty": [1 << 64], "name": ["a"]})
+    assert frame.column("qty") == [1 << 64]
+
+
+@pytest.mark.parametrize(
+    "column", [bytes(range(8)), bytearray(range(8)), array("b", range(8))], ids=["bytes", "bytearray", "array"]
+)
+def test_validate_columns_buffer(column: bytes) -> None:
+    frame = SampleSlotsModel.validate_columns({"value": column})
+
+    assert frame.column("value") == array("q", range(8))
+
+
+def test_validate_columns_invalid() -> None:
+    with pytest.raises(ValidationError) as ex:
+        SampleModel.validate_columns({"price": [1.0, 2.0, "a"], "qty": [1, 2, 3], "name": ["a", "b", "c"]})
+
+    assert ex.value.get_full_field_name() == "price.2"
+
+
+def test_validate_columns_length() -> None:
+    with pytest.raises(ValidationError) as ex:
+        SampleModel.validate_columns({"price": [1.0, 2.0], "qty": [1], "name": ["a", "b"]})
+
+    assert ex.value.get_full_field_name() == "qty"
+
+
+def test_validate_columns_required() -> None:
+    with pytest.raises(RequiredFieldError):
+        SampleModel.validate_columns({"price": [1.0], "qty": [1]})
+
+
+def test_validate_columns_slots() -> None:
+    frame = SampleSlotsModel.validate_columns({"value": [1]})
+
+    assert frame[0].value == 1
+    assert frame[0].note is None
+
+
+def test_validate_columns_frozen() -> None:
+    frame = SampleFrozenModel.validate_columns({"value": [1, 2], "names": [["a"], ["b", "c"]]})
+
+    assert frame[1] == SampleFrozenModel(value=2, names=["b", "c"])
+    assert len(set(frame)) == 2
@@ -0,0 +1,65 @@
+import pytest
+
+from polymathes.errors import RequiredFieldError
+from polymathes.models import BaseModel
+
+
+class SampleModel(BaseModel):
+    value: int
+    items: list[int]
+    default: int = 1
+
+
+class SampleSlotsModel(BaseModel, slots=True):
+    value: int
+    default: int = 1
+
+
+def test_construct() -> None:
+    items = [1, 2]
+    model = SampleModel.construct(value="not validated", items=items)
+
+    assert model.value == "not validated"
+    assert model.items is items
+    assert model.dump() == {"value": "not validated", "items": [1, 2], "default": 1}
+
+
+def test_construct_slots() -> None:
+    assert SampleSlotsModel.construct(value=1).dump() == {"value": 1, "default": 1}
+
+
+class SampleAssignmentModel(BaseModel, validate_assignment=True):
+    value: int
+
+
+def test_construct_validate_assignment() -> None:
+    assert SampleAssignmentModel.construct(value="5").value == "5"
+
+
+class SampleFrozenModel(BaseModel, frozen=True):
+    value: int
+
+
+class SampleFrozenSlotsModel(BaseModel, slots=True, frozen=True):
+    value: int
+
+
+@pytest.mark.parametrize("model", [SampleFrozenModel, SampleFrozenSlotsModel])
+def test_construct_frozen(model: type[SampleFrozenModel]) -> None:
+    instance = model.construct(value=1)
+
+    assert instance == model(value=1)
+
+    with pytest.raises(AttributeError):
+        instance.value = 2
+
+
+def test_construct_required() -> None:
+    with pytest.raises(RequiredFieldError):
+        SampleModel.construct(items=[])
+
+
+def test_construct_many() -> None:
+    models = SampleModel.construct_many([{"value": 1, "items": []}, {"value": 2, "items": [], "default": 3}])
+
+    assert [(model.value, model.default) for model in models] == [(1, 1), (2, 3)]
@@ -0,0 +1,70 @@
+from enum import Enum
+from typing import Annotated, Literal
+
+import pytest
+
+from polymathes.annotations import Discriminator
+from polymathes.errors import ValidationError
+from polymathes.models import BaseModel
+
+
+class SampleKind(Enum):
+    C = "c"
+
+
+class SampleA(BaseModel):
+    kind: Literal["a"]
+    value: int
+
+
+class SampleB(BaseModel):
+    kind: Literal["b"]
+    value: str
+
+
+class SampleC(BaseModel):
+    kind: Literal[SampleKind.C]
+    value: float
+
+
+class SampleModel(BaseModel):
+    value: Annotated[SampleA | SampleB | SampleC, Discriminator("kind")]
+
+
+def test_value_dispatch() -> None:
+    assert isinstance(SampleModel(value={"kind": "a", "value": "1"}).value, SampleA)
+    assert isinstance(SampleModel(value={"kind": "b", "value": 1}).value, SampleB)
+    assert SampleModel(value={"kind": "b", "value": 1}).value.value == "1"
+
+
+def test_value_enum() -> None:
+    assert SampleModel(value={"kind": SampleKind.C, "value": 1}).value.kind is SampleKind.C
+    assert SampleModel(value={"kind": "C", "value": 1}).value.kind is SampleKind.C
+
+
+def test_value_unknown_tag() -> None:
+    with pytest.raises(ValidationError):
+        SampleModel(value={"kind": "d", "value": 1})
+
+    with pytest.raises(ValidationError):
+        SampleModel(value={"value": 1})
+
+    with pytest.raises(ValidationError):
+        SampleModel(value=1)
+
+
+def test_value_selected_error() -> None:
+    with pytest.raises(ValidationError) as ex:
+        SampleModel(value={"kind": "a", "value": "x"})
+
+    assert ex.value.get_full_field_name() == "value.value"
+
+
+def test_not_literal() -> None:
+    class SampleWrong(BaseModel):
+        kind: str
+
+    with pytest.raises(TypeError):
+
+        class SampleWrongModel(BaseModel):
+            value: Annotated[SampleA | SampleWrong, Discriminator("kind")]
@@ -0,0 +1,112 @@
+import json
+from enum import Enum, IntEnum
+
+import pytest
+
+from polymathes.models import BaseModel
+
+
+class SampleEnum(Enum):
+    A = 1
+    B = 2
+
+
+class SampleIntEnum(IntEnum):
+    C = 3
+
+
+class SampleItem(BaseModel):
+    value: int
+    color: SampleEnum
+
+
+class SampleModel(BaseModel):
+    name: str
+    item: SampleItem
+    items: list[SampleItem]
+    pair: tuple[SampleItem, int]
+    mapping: dict[SampleEnum, SampleItem]
+    number: SampleIntEnum
+    optional: SampleItem | None
+    scores: list[float]
+
+
+class SampleSlotsModel(BaseModel, slots=True):
+    item: SampleItem
+    value: int | None = 1
+
+
+DATA = {
+    "name": "é",
+    "item": {"value": 1, "color": "A"},
+    "items": [{"value": 2, "color": "B"}],
+    "pair": ({"value": 3, "color": "A"}, 4),
+    "mapping": {"B": {"value": 5, "color": "B"}},
+    "number": SampleIntEnum.C,
+    "optional": None,
+    "scores": [1.5, float("inf")],
+}
+
+DUMPED = {
+    "name": "é",
+    "item": {"value": 1, "color": "A"},
+    "items": [{"value": 2, "color": "B"}],
+    "pair": ({"value": 3, "color": "A"}, 4),
+    "mapping": {"B": {"value": 5, "color": "B"}},
+    "number": "C",
+    "optional": None,
+    "scores": [1.5, float("inf")],
+}
+
+
+def test_dump_recursive() -> None:
+    assert SampleModel(**DATA).dump() == DUMPED
+
+
+def test_dump_round_trip() -> None:
+    model = SampleModel(**DATA)
+
+    assert SampleModel(**model.dump()).dump() == DUMPED
+
+
+def test_dump_shares_plain_values() -> None:
+    model = SampleModel(**DATA)
+
+    assert model.dump()["scores"] is model.scores
+
+
+def test_dump_include_exclude() -> None:
+    model = SampleModel(**DATA)
+
+    assert model.dump(include={"name", "number"}) == {"name": "é", "number": "C"}
+    assert model.dump(include={"name", "number"}, exclude={"number"}) == {"name": "é"}
+    assert set(model.dump(exclude={"items", "pair"})) == set(DUMPED) - {"items", "pair"}
+
+
+def test_dump_slots() -> None:
+    model = SampleSlotsModel(item={"value": 1, "color": "A"})
+
+    assert model.dump() == {"item": {"value": 1, "color": "A"}, "value": None}
+
+
+def test_dump_json() -> None:
+    model = SampleModel(**DATA)
+    expected = json.dumps(DUMPED, ensure_ascii=False, separators=(",", ":")).encode()
+
+    assert model.dump_json() == expected
+    assert model.dump_json(include={"number"}) == b'{"number":"C"}'
+
+
+def test_dump_json_buffer() -> None:
+    model = SampleItem(value=1, color="A")
+    buffer = bytearray(b"[")
+
+    assert model.dump_json(buffer) is buffer
+    assert buffer == b'[{"value":1,"color":"A"}'
+
+
+def test_dump_json_unsupported() -> None:
+    model = SampleItem.construct(value=object(), color="A")
+
+    with pytest.raises(TypeError):
+        model.dump_json()
@@ -0,0 +1,56 @@
+import pickle
+
+import pytest
+
+from polymathes.errors import RequiredFieldError, UnexpectedTypeError, ValidationError
+from polymathes.models import BaseModel
+
+
+class SubModel(BaseModel):
+    value: int
+
+
+class SampleModel(BaseModel):
+    items: list[SubModel]
+
+
+def raise_nested() -> ValidationError:
+    with pytest.raises(ValidationError) as ex:
+        SampleModel(items=[{"value": 1}, {"value": "a"}])
+
+    return ex.value
+
+
+def test_error_path() -> None:
+    ex = raise_nested()
+
+    assert ex.path == ("items", 1, "value")
+    assert ex.get_full_field_name() == "items.1.value"
+    assert ex.path is ex.path
+
+
+def test_error_message() -> None:
+    ex = raise_nested()
+
+    assert str(ex) == ex.message == f"Expected {int}, got {str}"
+    assert str(UnexpectedTypeError("a", int, "x")) == f"Expected {int}, got {str}"
+    assert str(RequiredFieldError("a", int)) == f"Field 'a': {int} is required"
+    assert str(ValidationError("Invalid", "a", None)) == "Invalid"
+
+
+def test_error_args() -> None:
+    ex = raise_nested()
+
+    assert ex.args == (f"Expected {int}, got {str}",)
+    assert UnexpectedTypeError("a", int, "x").args == (f"Expected {int}, got {str}",)
+    assert ValidationError("Invalid", "a", None).args == ("Invalid",)
+
+
+def test_error_pickle() -> None:
+    ex = pickle.loads(pickle.dumps(raise_nested()))
+
+    assert isinstance(ex, ValidationError)
+    assert ex.path == ("items", 1, "value")
+    assert isinstance(ex.base_ex.base_ex, UnexpectedTypeError)
+    assert str(ex) == f"Expected {int}, got {str}"
+    assert ex.args == (str(ex),)
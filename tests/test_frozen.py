@@ -0,0 +1,192 @@
+import copy
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from polymathes import Float64Array
+from polymathes.errors import ValidationError
+from polymathes.frozen import HASH
+from polymathes.models import BaseModel
+
+
+class SubModel(BaseModel, frozen=True):
+    value: int
+
+
+class SampleModel(BaseModel, frozen=True):
+    value: int
+    items: list[list[str]]
+    pair: tuple[int, list[int]]
+    sub: SubModel
+    default: str | None = None
+
+
+class SampleCodegenModel(SampleModel, codegen=True):
+    pass
+
+
+class SampleSlotsModel(BaseModel, slots=True, frozen=True):
+    value: int
+    items: list[int]
+
+
+class SampleMutableModel(SampleModel, frozen=False):
+    pass
+
+
+def build(model: type[SampleModel] = SampleModel, value: int = 1) -> SampleModel:
+    return model(value=value, items=[["a"], [1]], pair=(1, [2]), sub={"value": 3})
+
+
+@pytest.mark.parametrize("model", [SampleModel, SampleCodegenModel])
+def test_frozen(model: type[SampleModel]) -> None:
+    instance = build(model)
+
+    assert instance.items == (("a",), ("1",))
+    assert instance.pair == (1, (2,))
+
+    with pytest.raises(AttributeError):
+        instance.value = 2
+
+    with pytest.raises(AttributeError):
+        del instance.value
+
+    with pytest.raises(AttributeError):
+        instance.update(value=2)
+
+    assert instance.value == 1
+
+
+def test_frozen_invalid() -> None:
+    with pytest.raises(ValidationError):
+        SampleModel(value=1, items=[1], pair=(1, []), sub={"value": 3})
+
+
+def test_frozen_eq() -> None:
+    model = build()
+
+    assert model == model
+    assert model == build()
+    assert model != build(value=2)
+    assert model != build(SampleCodegenModel)
+    assert model != 1
+
+
+def test_frozen_hash() -> None:
+    model = build()
+
+    assert hash(model) == hash(build())
+    assert model.__dict__[HASH] == hash(model)
+    assert len({model, build(), build(value=2)}) == 2
+    assert {model: 1}[build()] == 1
+
+
+def test_frozen_dump() -> None:
+    model = build()
+
+    assert model.dump() == {
+        "value": 1,
+        "items": (("a",), ("1",)),
+        "pair": (1, (2,)),
+        "sub": {"value": 3},
+        "default": None,
+    }
+    assert SampleModel(**model.dump()) == model
+    assert model.dump_json() == b'{"value":1,"items":[["a"],["1"]],"pair":[1,[2]],"sub":{"value":3},"default":null}'
+
+
+def test_frozen_copy() -> None:
+    model = build()
+    hash(model)
+
+    copied = model.copy(update={"value": 2})
+
+    assert copied.value == 2
+    assert hash(copied) == hash(build(value=2))
+
+
+def test_frozen_slots() -> None:
+    model = SampleSlotsModel(value=1, items=[1])
+
+    assert not hasattr(model, "__dict__")
+    assert hash(model) == hash(SampleSlotsModel(value=1, items=(1,)))
+    assert model == SampleSlotsModel(value="1", items=[1])
+
+    with pytest.raises(AttributeError):
+        model.value = 2
+
+    assert model.copy(update={"value": 2}) != model
+
+
+@pytest.mark.parametrize("model", [SampleModel, SampleCodegenModel])
+def test_frozen_json(model: type[SampleModel]) -> None:
+    document = '{"value": 1, "items": [["a"], [1]], "pair": [1, [2]], "sub": {"value": 3}}'
+
+    assert model.validate_json(document) == build(model)
+
+
+class SampleParentModel(BaseModel, codegen=True, frozen=True):
+    child: SampleCodegenModel
+
+
+def test_frozen_json_nested() -> None:
+    document = '{"child": {"value": 1, "items": [], "pair": [1, []], "sub": {"value": 3}}}'
+
+    assert SampleParentModel.validate_json(document).child.pair == (1, ())
+
+
+@pytest.mark.parametrize("build_model", [build, lambda: SampleSlotsModel(value=1, items=[1])])
+def test_frozen_pickle(build_model) -> None:
+    model = build_model()
+    hash(model)
+
+    for copied in (pickle.loads(pickle.dumps(model)), copy.copy(model), copy.deepcopy(model)):
+        assert copied == model
+        assert hash(copied) == hash(model)
+
+        with pytest.raises(AttributeError):
+            copied.value = 2
+
+
+def test_frozen_pickle_hash() -> None:
+    # The cached hash isn't pickled, since it changes with the hash seed of each process.
+    code = "import pickle, sys; sys.stdout.buffer.write(pickle.dumps(__import__('test_frozen').build()))"
+    data = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        env={"PYTHONHASHSEED": "1", "PYTHONPATH": ":".join(sys.path)},
+    ).stdout
+
+    model = pickle.loads(data)
+
+    assert HASH not in model.__dict__
+    assert model in {build()}
+
+
+def test_frozen_validate_many() -> None:
+    models = SampleSlotsModel.validate_many([{"value": index, "items": [index]} for index in range(4)], workers=2)
+
+    assert models == [SampleSlotsModel(value=index, items=[index]) for index in range(4)]
+
+
+class MutableSubModel(BaseModel):
+    value: int
+
+
+@pytest.mark.parametrize(
+    "field_type", [dict[str, int], list[dict[str, int]], Float64Array, MutableSubModel, list, dict, set, list[set]]
+)
+def test_frozen_unhashable(field_type: type) -> None:
+    with pytest.raises(TypeError, match="Field 'field' of the frozen model Sample can't be hashed"):
+        type("Sample", (BaseModel,), {"__annotations__": {"field": field_type}}, frozen=True)
+
+
+def test_frozen_disabled() -> None:
+    model = build(SampleMutableModel)
+    model.value = 2
+
+    assert model.value == 2
+    assert model != build(SampleMutableModel)
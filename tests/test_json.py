@@ -0,0 +1,191 @@
+import json
+from typing import Annotated, Literal
+
+import pytest
+
+from polymathes import Discriminator
+from polymathes.errors import RequiredFieldError, UnexpectedTypeError, ValidationError
+from polymathes.models import BaseModel
+
+
+class SampleSubModel(BaseModel):
+    a: int
+    b: str | None = None
+
+
+class SampleModel(BaseModel):
+    value: int
+    items: list[SampleSubModel]
+    pair: tuple[int, str]
+    mapping: dict[str, SampleSubModel]
+    sub: SampleSubModel
+
+
+DOCUMENT = {
+    "value": "1",
+    "ignored": {"x": [1, 2]},
+    "items": [{"a": 1}, {"a": "2", "b": "x"}],
+    "pair": [1, 2],
+    "mapping": {"k": {"a": 3}},
+    "sub": {"a": 4},
+}
+
+
+@pytest.mark.parametrize("wrap", [str, str.encode, lambda s: bytearray(s.encode()), lambda s: memoryview(s.encode())])
+def test_validate_json(wrap) -> None:
+    model = SampleModel.validate_json(wrap(json.dumps(DOCUMENT, indent=2)))
+
+    assert model.value == 1
+    assert [item.a for item in model.items] == [1, 2]
+    assert model.items[1].b == "x"
+    assert model.pair == (1, "2")
+    assert model.mapping["k"].a == 3
+    assert model.sub.a == 4
+    assert model.sub.b is None
+
+
+def test_validate_json_errors() -> None:
+    with pytest.raises(ValidationError) as ex:
+        SampleModel.validate_json(json.dumps({**DOCUMENT, "items": [{"a": 1}, {"a": "x"}]}))
+
+    assert ex.value.get_full_field_name() == "items.1.a"
+
+    with pytest.raises(ValidationError) as ex:
+        SampleModel.validate_json(json.dumps({**DOCUMENT, "pair": [1, 2, 3]}))
+
+    assert ex.value.get_full_field_name() == "pair.pair"
+
+    with pytest.raises(RequiredFieldError):
+        SampleModel.validate_json(json.dumps({"value": 1}))
+
+
+def test_validate_json_fail_early() -> None:
+    with pytest.raises(ValidationError):
+        SampleModel.validate_json('{"value": "x", "items": [{"a": 1}, ')
+
+
+def test_validate_json_invalid() -> None:
+    with pytest.raises(json.JSONDecodeError):
+        SampleModel.validate_json(json.dumps(DOCUMENT) + " x")
+
+    with pytest.raises(json.JSONDecodeError):
+        SampleModel.validate_json('{"value": 1 "items": []}')
+
+
+class SamplePairModel(BaseModel):
+    pair: tuple[int, int]
+
+
+class SampleNestedModel(BaseModel):
+    items: list[SamplePairModel]
+    mapping: dict[str, tuple[int, ...]]
+
+
+class SampleRepeatedModel(BaseModel):
+    a: int
+    b: dict[str, SamplePairModel]
+
+
+def test_validate_json_repeated_keys() -> None:
+    # Like `json.loads`, the last value of a repeated key is kept.
+    document = '{"a": "x", "b": {"k": {"pair": ["x", 1]}, "k": {"pair": [1, 2]}}, "a": 1}'
+    model = SampleRepeatedModel.validate_json(document)
+
+    assert model.a == 1
+    assert model.b["k"].pair == (1, 2)
+
+    with pytest.raises(ValidationError) as ex:
+        SampleRepeatedModel.validate_json('{"a": 1, "b": {}, "a": "x"}')
+
+    assert ex.value.get_full_field_name() == "a"
+
+    with pytest.raises(ValidationError) as ex:
+        SampleRepeatedModel.validate_json('{"a": 1, "b": {"k": {"pair": [1, 2]}, "k": {"pair": ["x", 1]}}}')
+
+    # Dict values are named after the value itself, like `DictValidator` does.
+    assert ex.value.get_full_field_name() == "b.{'pair': ['x', 1]}.pair.0"
+
+
+def test_validate_json_nested_tuples() -> None:
+    model = SampleNestedModel.validate_json('{"items": [{"pair": [1, "2"]}], "mapping": {"a": [1, 2, 3]}}')
+
+    assert model.items[0].pair == (1, 2)
+    assert model.mapping == {"a": (1, 2, 3)}
+
+    with pytest.raises(ValidationError) as ex:
+        SampleNestedModel.validate_json('{"items": [{"pair": [1, "x"]}], "mapping": {}}')
+
+    assert ex.value.get_full_field_name() == "items.0.pair.1"
+
+
+class SampleCatModel(BaseModel):
+    kind: Literal["cat"]
+    pair: tuple[int, int]
+
+
+class SampleUnionModel(BaseModel):
+    optional: tuple[int, int] | None
+    either: list[int] | tuple[str, str]
+    pet: Annotated[SampleCatModel, Discriminator("kind")]
+
+
+def test_validate_json_unions() -> None:
+    model = SampleUnionModel.validate_json(
+        '{"optional": [1, "2"], "either": ["a", "b"], "pet": {"kind": "cat", "pair": [3, 4]}}'
+    )
+
+    assert model.optional == (1, 2)
+    assert model.either == ("a", "b")
+    assert model.pet.pair == (3, 4)
+
+    model = SampleUnionModel.validate_json('{"optional": null, "either": [1], "pet": {"kind": "cat", "pair": [3, 4]}}')
+
+    assert model.optional is None
+    assert model.either == [1]
+
+
+class SampleLazyModel(BaseModel, lazy=True):
+    pair: tuple[int, int]
+    items: list[SamplePairModel]
+
+
+class SampleInitModel(BaseModel):
+    pair: tuple[int, int]
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+
+
+class SampleParentModel(BaseModel):
+    child: SampleInitModel
+
+
+def test_validate_json_own_init() -> None:
+    model = SampleLazyModel.validate_json('{"pair": [1, 2], "items": [{"pair": [3, 4]}]}')
+
+    assert model.pair == (1, 2)
+    assert model.items[0].pair == (3, 4)
+    assert SampleParentModel.validate_json('{"child": {"pair": [1, 2]}}').child.pair == (1, 2)
+
+
+class SampleDictModel(BaseModel):
+    mapping: dict[str, tuple[int, int]]
+
+
+def test_validate_json_dict_error() -> None:
+    with pytest.raises(ValidationError) as ex:
+        SampleDictModel.validate_json('{"mapping": {"a": [1, "x"]}}')
+
+    assert ex.value.path == ("mapping", [1, "x"], 1)
+    assert isinstance(ex.value.base_ex.base_ex, UnexpectedTypeError)
+    assert ex.value.base_ex.base_ex.field_type is int
+
+
+def test_validate_json_fields_replaced(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert SamplePairModel.validate_json('{"pair": [1, 2]}').pair == (1, 2)
+
+    # The plan of the model is built again from the new fields.
+    monkeypatch.setattr(SamplePairModel, "__fields__", SampleSubModel.__fields__[:1])
+
+    with pytest.raises(RequiredFieldError):
+        SamplePairModel.validate_json('{"pair": [1, 2]}')
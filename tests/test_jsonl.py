@@ -0,0 +1,73 @@
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from polymathes.errors import LineError
+from polymathes.models import BaseModel
+
+
+class SampleModel(BaseModel):
+    value: int
+    name: str
+
+
+DATA = b'{"value": 1, "name": "a"}\n\n{"value": "2", "name": "\xc3\xa9"}\r\n{"value": 3, "name": "c"}'
+INVALID = b'{"value": 1, "name": "a"}\n{"value": "x", "name": "b"}\n{"value": \n[1]\n{"value": 2, "name": "\xff"}\n'
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+def test_file(chunk_size: int) -> None:
+    models = list(SampleModel.iter_jsonl(BytesIO(DATA), chunk_size=chunk_size))
+
+    assert [model.value for model in models] == [1, 2, 3]
+    assert models[1].name == "é"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+def test_path(tmp_path: Path, chunk_size: int) -> None:
+    path = tmp_path / "data.jsonl"
+    path.write_bytes(DATA)
+
+    assert [model.value for model in SampleModel.iter_jsonl(path, chunk_size=chunk_size)] == [1, 2, 3]
+
+
+def test_empty_path(tmp_path: Path) -> None:
+    path = tmp_path / "data.jsonl"
+    path.write_bytes(b"")
+
+    assert list(SampleModel.iter_jsonl(path)) == []
+
+
+def test_raise() -> None:
+    models = SampleModel.iter_jsonl(BytesIO(INVALID))
+
+    assert next(models).value == 1
+
+    with pytest.raises(LineError) as ex:
+        next(models)
+
+    assert ex.value.line_number == 2
+    assert ex.value.offset == 26
+    assert ex.value.get_full_field_name() == "2.value"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1 << 20])
+def test_collect(chunk_size: int) -> None:
+    errors = []
+    models = list(SampleModel.iter_jsonl(BytesIO(INVALID), errors=errors, chunk_size=chunk_size))
+
+    assert [model.value for model in models] == [1]
+    assert [(error.line_number, error.offset) for error in errors] == [(2, 26), (3, 54), (4, 65), (5, 69)]
+    assert errors[0].value == b'{"value": "x", "name": "b"}'
+    assert errors[1].message.startswith("Expecting value: line 1 column 11")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+def test_collect_extra_data(chunk_size: int) -> None:
+    errors = []
+    data = b'{"value": 1, "name": "a"} {}\n{"value": 2, "name": "b"}\n'
+    models = list(SampleModel.iter_jsonl(BytesIO(data), errors=errors, chunk_size=chunk_size))
+
+    assert [model.value for model in models] == [2]
+    assert [(error.line_number, error.message) for error in errors] == [(1, "Extra data after the record")]
@@ -0,0 +1,121 @@
+from typing import Any
+
+import pytest
+
+from polymathes.errors import RequiredFieldError, ValidationError
+from polymathes.lazy import RAW
+from polymathes.models import BaseModel
+from polymathes.validators import WrapperValidator
+
+
+class SampleModel(BaseModel, lazy=True):
+    value: int
+    items: list[int]
+    default: int | None = 1
+
+
+class SampleChildModel(SampleModel):
+    pass
+
+
+class SampleParentModel(BaseModel):
+    child: SampleModel
+
+
+def test_lazy_validates_on_access() -> None:
+    model = SampleModel(value="1", items=["2", "not an int"])
+
+    assert model.value == 1
+    assert model.__dict__[RAW] == {"items": ["2", "not an int"], "default": None}
+
+    with pytest.raises(ValidationError):
+        _ = model.items
+
+
+def test_lazy_caches_value() -> None:
+    model = SampleModel(value="1", items=[])
+
+    assert model.items is model.items
+    assert model.__dict__["items"] == []
+
+
+def test_lazy_concurrent_access(monkeypatch: pytest.MonkeyPatch) -> None:
+    model = SampleModel(value="1", items=[])
+    descriptor = SampleModel.__dict__["items"]
+
+    class ConcurrentValidator(WrapperValidator):
+        __slots__ = ()
+
+        def validate(self, field_name: int | str, value: Any, strict: bool = False) -> Any:
+            # Another thread reads the field while this one validates it.
+            monkeypatch.setattr(descriptor, "validator", self.validator)
+            assert model.items == []
+
+            return super().validate(field_name, value, strict)
+
+    monkeypatch.setattr(descriptor, "validator", ConcurrentValidator(descriptor.validator))
+
+    assert model.items == []
+    assert "items" not in model.__dict__[RAW]
+
+
+def test_lazy_required() -> None:
+    with pytest.raises(RequiredFieldError):
+        SampleModel(value=1)
+
+
+def test_lazy_default() -> None:
+    assert SampleModel.default == 1
+    assert not hasattr(SampleModel, "value")
+    assert SampleModel(value=1, items=[]).default is None
+
+
+def test_lazy_validate_all() -> None:
+    model = SampleModel(value="1", items=["2"])
+
+    assert model.validate_all() is model
+    assert model.__dict__[RAW] == {}
+    assert model.items == [2]
+
+    with pytest.raises(ValidationError):
+        SampleModel(value=1, items=["not an int"]).validate_all()
+
+
+def test_lazy_dump() -> None:
+    assert SampleModel(value="1", items=["2"], default=3).dump() == {"value": 1, "items": [2], "default": 3}
+
+    with pytest.raises(ValidationError):
+        SampleModel(value="not an int", items=[]).dump()
+
+
+def test_lazy_assignment() -> None:
+    model = SampleModel(value="not an int", items=[])
+    model.value = 2
+
+    assert model.dump() == {"value": 2, "items": [], "default": None}
+
+
+def test_lazy_subclass() -> None:
+    model = SampleChildModel(value="1", items=[])
+
+    assert model.value == 1
+
+
+def test_lazy_submodel() -> None:
+    model = SampleParentModel(child={"value": "not an int", "items": []})
+
+    with pytest.raises(ValidationError):
+        _ = model.child.value
+
+
+def test_lazy_construct() -> None:
+    model = SampleModel.construct(value="not validated", items=[])
+
+    assert model.dump() == {"value": "not validated", "items": [], "default": 1}
+
+
+def test_lazy_slots() -> None:
+    with pytest.raises(TypeError):
+
+        class SampleSlotsModel(BaseModel, lazy=True, slots=True):
+            value: int
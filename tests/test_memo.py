@@ -0,0 +1,125 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+
+import pytest
+
+from polymathes.errors import ValidationError
+from polymathes.memo import fingerprint
+from polymathes.models import BaseModel
+
+
+class Color(Enum):
+    RED = 1
+    BLUE = 2
+
+
+class SampleModel(BaseModel, frozen=True, cache_size=2):
+    value: int | bool
+    color: Color
+    items: list[str] | None = None
+
+
+class SampleParentModel(BaseModel):
+    sub: SampleModel
+
+
+class SampleCachedParentModel(BaseModel, frozen=True, cache_size=10):
+    sub: SampleModel
+
+
+@pytest.fixture(autouse=True)
+def clear() -> None:
+    SampleModel.cache_clear()
+    SampleCachedParentModel.cache_clear()
+
+
+def test_cache_hit() -> None:
+    model = SampleModel(value=1, color="RED")
+
+    assert SampleModel(value=1, color="RED") is model
+    assert SampleModel(value=2, color="RED") is not model
+    assert SampleModel.cache_info() == {"hits": 1, "misses": 2, "evictions": 0, "size": 2, "maxsize": 2}
+
+
+def test_cache_types() -> None:
+    # Equal inputs of different types may validate differently.
+    assert SampleModel(value=1, color="RED").value is not True
+    assert SampleModel(value=True, color="RED").value is True
+
+
+class SampleNumberModel(BaseModel, frozen=True, cache_size=10):
+    text: str
+    number: float
+
+
+def test_cache_floats() -> None:
+    assert SampleNumberModel(text=0.0, number=0.0).text == "0.0"
+    assert SampleNumberModel(text=-0.0, number=-0.0).text == "-0.0"
+    assert str(SampleNumberModel(text=1, number=-0.0).number) == "-0.0"
+    assert SampleNumberModel.cache_info()["size"] == 3
+
+
+def test_cache_eviction() -> None:
+    first = SampleModel(value=1, color="RED")
+    SampleModel(value=2, color="RED")
+    SampleModel(value=1, color="RED")
+    SampleModel(value=3, color="RED")
+
+    assert SampleModel(value=1, color="RED") is first
+    assert SampleModel.cache_info()["evictions"] == 1
+    assert SampleModel.cache_info()["size"] == 2
+
+
+def test_cache_nested() -> None:
+    data = {"sub": {"value": 1, "color": "BLUE", "items": ["a"]}}
+
+    assert SampleParentModel(**data).sub is SampleParentModel(**data).sub
+    assert SampleParentModel(**data).sub.items == ("a",)
+
+
+def test_cache_unhashable() -> None:
+    data = OrderedDict(value=1, color="RED")
+    SampleCachedParentModel(sub=data)
+    SampleCachedParentModel(sub=data)
+
+    assert SampleCachedParentModel.cache_info()["misses"] == 2
+    assert SampleCachedParentModel.cache_info()["size"] == 0
+    assert SampleModel.cache_info()["hits"] == 1
+
+
+def test_cache_errors() -> None:
+    with pytest.raises(ValidationError):
+        SampleModel(value="a", color="RED")
+
+    assert SampleModel.cache_info()["size"] == 0
+
+
+def test_cache_threads() -> None:
+    with ThreadPoolExecutor(4) as executor:
+        models = list(executor.map(lambda i: SampleModel(value=i % 2, color="RED"), range(1000)))
+
+    assert len({id(model) for model in models}) <= 4
+    info = SampleModel.cache_info()
+    assert info["hits"] + info["misses"] == 1000
+
+
+def test_cache_requires_frozen() -> None:
+    with pytest.raises(TypeError):
+
+        class SampleMutableModel(BaseModel, cache_size=10):
+            value: int
+
+
+def test_no_cache() -> None:
+    assert SampleParentModel.cache_info() is None
+
+
+def test_fingerprint() -> None:
+    assert fingerprint({"a": [1, (2,)]}) == fingerprint({"a": [1, (2,)]})
+    assert fingerprint({"a": 1}) != fingerprint({"a": True})
+    assert fingerprint([1]) != fingerprint((1,))
+    assert fingerprint(0.0) != fingerprint(-0.0)
+
+    with pytest.raises(TypeError):
+        fingerprint({"a": {1}})
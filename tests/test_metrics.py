@@ -0,0 +1,160 @@
+import pytest
+
+from polymathes import Metrics
+from polymathes.errors import ValidationError
+from polymathes.models import BaseModel
+
+
+class SampleModel(BaseModel):
+    value: int
+    items: list[str]
+
+
+class SampleCodegenModel(BaseModel, codegen=True):
+    value: int
+    items: list[str]
+
+
+class SampleFrozenModel(BaseModel, codegen=True, frozen=True):
+    value: int
+    items: list[str]
+
+
+class SampleFrozenSubModel(SampleFrozenModel):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+
+
+class SamplePairModel(BaseModel):
+    pair: tuple[int, int]
+
+
+class SampleParentModel(BaseModel):
+    child: SamplePairModel
+
+
+class SampleLazyModel(BaseModel, lazy=True):
+    value: int
+    items: list[str]
+
+
+@pytest.mark.parametrize("model", [SampleModel, SampleCodegenModel])
+def test_metrics(model: type[SampleModel]) -> None:
+    metrics = Metrics()
+    metrics.install(model)
+
+    try:
+        model(value=1, items=["a"])
+        model(value="2", items=[])
+        with pytest.raises(ValidationError):
+            model(value="a", items=[])
+    finally:
+        metrics.uninstall(model)
+
+    model(value=1, items=[])
+
+    stats = metrics.snapshot()[f"{model.__module__}.{model.__qualname__}"]
+    assert stats == {
+        "calls": 3,
+        "failures": 1,
+        "fields": {
+            "value": {"calls": 3, "failures": 1, "coercions": 1},
+            "items": {"calls": 2, "failures": 0, "coercions": 0},
+        },
+    }
+
+
+def test_metrics_frozen() -> None:
+    metrics = Metrics()
+    metrics.install(SampleFrozenModel)
+
+    try:
+        assert SampleFrozenSubModel(value="1", items=["a"]).items == ("a",)
+    finally:
+        metrics.uninstall(SampleFrozenModel)
+
+    assert metrics.snapshot()[f"{__name__}.SampleFrozenModel"]["calls"] == 1
+
+
+def test_metrics_uninstall() -> None:
+    fields = SampleCodegenModel.__fields__
+    init = SampleCodegenModel.__init__
+
+    metrics = Metrics()
+    metrics.install(SampleModel)
+    metrics.install(SampleCodegenModel)
+    metrics.uninstall(SampleModel)
+    metrics.uninstall(SampleCodegenModel)
+
+    assert SampleModel.__init__ is BaseModel.__init__
+    assert "__init__" not in SampleModel.__dict__
+    assert SampleCodegenModel.__fields__ is fields
+    assert SampleCodegenModel.__init__ is init
+
+
+def test_metrics_lazy() -> None:
+    metrics = Metrics()
+    metrics.install(SampleLazyModel)
+
+    try:
+        model = SampleLazyModel(value="1", items=[])
+        assert model.value == 1
+    finally:
+        metrics.uninstall(SampleLazyModel)
+
+    assert metrics.snapshot()[f"{__name__}.SampleLazyModel"]["fields"]["value"]["coercions"] == 1
+    assert SampleLazyModel(value=1, items=[]).value == 1
+
+
+def test_metrics_timing() -> None:
+    metrics = Metrics(timing=True)
+    metrics.install(SampleModel)
+
+    try:
+        SampleModel.validate_many([{"value": 1, "items": []}] * 3)
+    finally:
+        metrics.uninstall(SampleModel)
+
+    timings = metrics.snapshot()[f"{__name__}.SampleModel"]["fields"]["value"]["timings_ns"]
+    assert sum(timings.values()) == 3
+
+    metrics.reset()
+    assert metrics.snapshot()[f"{__name__}.SampleModel"]["calls"] == 0
+
+
+def test_metrics_reinstall() -> None:
+    metrics = Metrics()
+
+    for _ in range(2):
+        metrics.install(SampleModel)
+        metrics.install(SampleModel)
+        try:
+            SampleModel(value=1, items=[])
+        finally:
+            metrics.uninstall(SampleModel)
+
+    assert metrics.snapshot()[f"{__name__}.SampleModel"]["calls"] == 2
+    assert "__init__" not in SampleModel.__dict__
+
+
+@pytest.mark.parametrize("model", [SamplePairModel, SampleParentModel])
+def test_metrics_validate_json(model: type[BaseModel]) -> None:
+    # Parses before the installation, so the plan of the parent holds the fields of the child before they're wrapped
+    SampleParentModel.validate_json('{"child": {"pair": [1, 2]}}')
+
+    metrics = Metrics()
+    metrics.install(model)
+
+    try:
+        assert SamplePairModel.validate_json('{"pair": [1, 2]}').pair == (1, 2)
+        assert SampleParentModel.validate_json('{"child": {"pair": [3, 4]}}').child.pair == (3, 4)
+        with pytest.raises(ValidationError):
+            SampleParentModel.validate_json('{"child": {"pair": [1, "a"]}}')
+    finally:
+        metrics.uninstall(model)
+
+    stats = metrics.snapshot()[f"{model.__module__}.{model.__qualname__}"]
+    if model is SamplePairModel:
+        assert stats["fields"]["pair"] == {"calls": 3, "failures": 1, "coercions": 0}
+    else:
+        assert stats["fields"]["child"] == {"calls": 2, "failures": 1, "coercions": 1}
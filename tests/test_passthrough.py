@@ -0,0 +1,62 @@
+from polymathes.models import BaseModel
+
+
+class SampleSubModel(BaseModel):
+    a: int
+
+
+class SampleChildModel(SampleSubModel):
+    pass
+
+
+class SampleCopySubModel(BaseModel, passthrough_copy=True, passthrough_subclasses=True):
+    a: int
+
+
+class SampleCopyChildModel(SampleCopySubModel):
+    pass
+
+
+class SampleRevalidateSubModel(BaseModel, passthrough=False):
+    a: int
+
+
+class SampleModel(BaseModel):
+    sub: SampleSubModel | None = None
+    copy: SampleCopySubModel | None = None
+    revalidate: SampleRevalidateSubModel | None = None
+
+
+def test_passthrough() -> None:
+    sub = SampleSubModel(a=1)
+
+    assert SampleModel(sub=sub).sub is sub
+
+
+def test_passthrough_subclass() -> None:
+    sub = SampleChildModel(a=1)
+    model = SampleModel(sub=sub)
+
+    assert type(model.sub) is SampleSubModel
+    assert model.sub.a == 1
+
+
+def test_passthrough_copy() -> None:
+    sub = SampleCopySubModel(a=1)
+    model = SampleModel(copy=sub)
+
+    assert model.copy is not sub
+    assert model.copy.a == 1
+
+    assert type(SampleModel(copy=SampleCopyChildModel(a=1)).copy) is SampleCopyChildModel
+
+
+def test_revalidate() -> None:
+    sub = SampleRevalidateSubModel(a=1)
+
+    assert SampleModel(revalidate=sub).revalidate is not sub
+
+
+def test_config_inherited() -> None:
+    assert SampleCopyChildModel.__config__.passthrough_copy
+    assert not SampleSubModel.__config__.passthrough_copy
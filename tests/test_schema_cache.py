@@ -0,0 +1,75 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from polymathes import enable_schema_cache
+from polymathes.models import BaseModel
+from polymathes.schemacache import SchemaCache, disable_schema_cache
+
+
+@pytest.fixture
+def cache_path(tmp_path: Path) -> Iterator[Path]:
+    yield tmp_path / "schema.cache"
+
+    disable_schema_cache()
+
+
+def make_model(field_type: type) -> type:
+    class SampleModel(BaseModel, codegen=True):
+        value: field_type
+        items: list[int]
+
+    return SampleModel
+
+
+def test_schema_cache(cache_path: Path) -> None:
+    cache = enable_schema_cache(cache_path)
+    model = make_model(int)
+
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert model(value="1", items=["2"]).items == [2]
+
+    disable_schema_cache()
+    assert cache_path.exists()
+
+    cache = enable_schema_cache(cache_path)
+    model = make_model(int)
+
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert model(value="1", items=["2"]).value == 1
+
+
+def test_schema_cache_invalidate(cache_path: Path) -> None:
+    enable_schema_cache(cache_path)
+    make_model(int)
+    disable_schema_cache()
+
+    cache = enable_schema_cache(cache_path)
+    model = make_model(list[str])
+
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert model(value=[1], items=[]).value == ["1"]
+
+
+def test_schema_cache_merge(cache_path: Path) -> None:
+    first = SchemaCache(cache_path)
+    second = SchemaCache(cache_path)
+
+    first.compile("a = 1\n", "<a>")
+    second.compile("b = 2\n", "<b>")
+    first.save()
+    second.save()
+
+    assert set(SchemaCache(cache_path).entries) == {"<a>", "<b>"}
+
+
+def test_schema_cache_corrupt(cache_path: Path) -> None:
+    cache_path.write_bytes(b"not a cache")
+
+    cache = SchemaCache(cache_path)
+    namespace = {}
+    exec(cache.compile("a = 1\n", "<a>"), namespace)
+
+    assert namespace["a"] == 1
+    assert cache.entries.keys() == {"<a>"}
@@ -0,0 +1,92 @@
+import pickle
+from abc import ABC, abstractmethod
+
+import pytest
+
+from polymathes.errors import ValidationError
+from polymathes.models import BaseModel
+
+
+class SampleModel(BaseModel, slots=True):
+    value: int
+    default: int | None = 1
+
+
+class SampleCodegenModel(BaseModel, slots=True, codegen=True):
+    value: int
+
+
+class SampleInheritedModel(SampleModel, slots=True):
+    value: int
+    extra: str
+
+
+def test_no_dict() -> None:
+    model = SampleModel(value="1")
+
+    assert not hasattr(model, "__dict__")
+    assert model.value == 1
+
+    with pytest.raises(AttributeError):
+        model.other = 1
+
+
+def test_default() -> None:
+    assert SampleModel(value=1).default is None
+    assert SampleModel.__field_defaults__ == {"default": 1}
+
+    with pytest.raises(ValidationError):
+        SampleModel()
+
+
+def test_methods() -> None:
+    model = SampleModel(value=1, default=2)
+
+    assert model.dump() == {"value": 1, "default": 2}
+    assert list(model.keys()) == ["value", "default"]
+    assert model["value"] == 1
+    assert repr(model) == "SampleModel(value=1, default=2)"
+    assert dict(model) == {"value": 1, "default": 2}
+
+
+def test_codegen() -> None:
+    assert SampleCodegenModel(value="1").value == 1
+
+
+def test_inherited() -> None:
+    model = SampleInheritedModel(value=1, extra=2)
+
+    assert not hasattr(model, "__dict__")
+    assert model.dump() == {"value": 1, "extra": "2"}
+
+
+def test_pickle() -> None:
+    assert pickle.loads(pickle.dumps(SampleModel(value=1))).dump() == {"value": 1, "default": None}
+
+
+class SampleMixin(ABC):
+    __slots__ = ()
+
+    @abstractmethod
+    def describe(self) -> str: ...
+
+
+@pytest.mark.parametrize("slots", [False, True])
+def test_abc_mixin(slots: bool) -> None:
+    class SampleABCModel(BaseModel, SampleMixin, slots=slots):
+        value: int
+
+        def describe(self) -> str:
+            return f"value={self.value}"
+
+    model = SampleABCModel(value="1")
+
+    assert model.describe() == "value=1"
+    assert isinstance(model, SampleMixin)
+    assert hasattr(model, "__dict__") is not slots
+
+    class SampleAbstractModel(BaseModel, SampleMixin):
+        value: int
+
+    with pytest.raises(TypeError, match="abstract"):
+        SampleAbstractModel(value=1)
@@ -49,3 +49,26 @@ def test_value_tuple() -> None:
 def test_value_dict() -> None:
     with pytest.raises(ValidationError):
         SampleModel(value={"a": 1, "b": 2, "c": 3})
+
+
+class SampleOrderModel(BaseModel):
+    value: int | bool | float
+
+
+class SampleContainerModel(BaseModel):
+    value: list[int] | dict[str, int] | tuple[str, ...]
+
+
+def test_value_order() -> None:
+    assert SampleOrderModel(value=True).value is True
+    assert type(SampleOrderModel(value=1).value) is int
+    assert type(SampleOrderModel(value=1.0).value) is float
+
+
+def test_value_container() -> None:
+    assert SampleContainerModel(value=[1, "2"]).value == [1, 2]
+    assert SampleContainerModel(value={"a": "1"}).value == {"a": 1}
+    assert SampleContainerModel(value=(1,)).value == ("1",)
+
+    with pytest.raises(ValidationError):
+        SampleContainerModel(value=["a"])
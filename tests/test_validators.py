@@ -0,0 +1,48 @@
+from polymathes.models import BaseModel
+from polymathes.validators import (
+    DictValidator,
+    ListValidator,
+    ModelValidator,
+    ScalarValidator,
+    TupleValidator,
+    UnionValidator,
+    compile_validator,
+)
+
+
+class SampleSubModel(BaseModel):
+    a: int
+
+
+class SampleModel(BaseModel):
+    value: int
+
+
+class SampleInheritedModel(SampleModel):
+    pass
+
+
+def test_compile_scalar() -> None:
+    validator = compile_validator(int)
+
+    assert isinstance(validator, ScalarValidator)
+    assert validator.field_type is int
+
+
+def test_compile_none() -> None:
+    assert compile_validator(None).field_type is type(None)
+
+
+def test_compile_nested() -> None:
+    validator = compile_validator(dict[str, list[tuple[int, ...] | SampleSubModel]])
+
+    assert isinstance(validator, DictValidator)
+    assert isinstance(validator.value, ListValidator)
+    assert isinstance(validator.value.item, UnionValidator)
+    assert isinstance(validator.value.item.options[0], TupleValidator)
+    assert validator.value.item.options[0].variadic
+    assert isinstance(validator.value.item.options[1], ModelValidator)
+
+
+def test_inherited_annotations() -> None:
+    assert SampleInheritedModel(value="1").value == 1